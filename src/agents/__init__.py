@@ -4,18 +4,24 @@ from src.agents.cartao_cnpj_extractor import (
     SocioQSA,
     build_cartao_cnpj_extractor_graph,
     extract_cartao_cnpj,
+    extract_cartao_cnpj_batch,
+    stream_cartao_cnpj,
 )
 from src.agents.certidao_negativa_federal_extractor import (
     CertidaoNegativaFederalData,
     CertidaoNegativaFederalExtractionResult,
     build_certidao_negativa_federal_extractor_graph,
     extract_certidao_negativa_federal,
+    extract_certidao_negativa_federal_batch,
+    stream_certidao_negativa_federal,
 )
 from src.agents.contrato_social_extractor import (
     ContratoSocialData,
     ContratoSocialExtractionResult,
     build_contrato_social_extractor_graph,
     extract_contrato_social,
+    extract_contrato_social_batch,
+    stream_contrato_social,
 )
 from src.agents.cross_document_analyzer import (
     CrossDocumentAnalysisResult,
@@ -36,16 +42,22 @@ __all__ = [
     "SocioQSA",
     "build_cartao_cnpj_extractor_graph",
     "extract_cartao_cnpj",
+    "extract_cartao_cnpj_batch",
+    "stream_cartao_cnpj",
     # Certidão Negativa Federal
     "CertidaoNegativaFederalData",
     "CertidaoNegativaFederalExtractionResult",
     "build_certidao_negativa_federal_extractor_graph",
     "extract_certidao_negativa_federal",
+    "extract_certidao_negativa_federal_batch",
+    "stream_certidao_negativa_federal",
     # Contrato Social
     "ContratoSocialData",
     "ContratoSocialExtractionResult",
     "build_contrato_social_extractor_graph",
     "extract_contrato_social",
+    "extract_contrato_social_batch",
+    "stream_contrato_social",
     # Cross Document Analyzer
     "CrossDocumentAnalysisResult",
     "Inconsistency",
@@ -1,18 +1,24 @@
 from __future__ import annotations
 
-import logging
 from datetime import date
 
-from langchain_core.messages import SystemMessage
-from langchain_core.runnables import RunnableConfig
-from langgraph.graph import END, StateGraph
-from pydantic import BaseModel, Field
-from typing_extensions import TypedDict
+from pydantic import BaseModel, ConfigDict, Field
 
-from src.core.base.agents import build_llm, build_runnable_config
-from src.exceptions import LLMExtractionError, LLMServiceError
+from src import enums
+from src.agents.structured_extractor import StructuredExtractor
 
-logger = logging.getLogger(__name__)
+SYSTEM_PROMPT = """Você é um assistente especializado em extrair dados estruturados de CARTÃO CNPJ (Comprovante de Inscrição e de Situação Cadastral) da Receita Federal do Brasil.
+
+Extraia os campos solicitados do texto fornecido.
+
+Regras:
+- Responda APENAS no formato estruturado solicitado.
+- Se algum campo não existir no texto, use null (ou lista vazia, quando aplicável).
+- NÃO invente valores. Se estiver incerto, reduza a confidence e descreva em notes.
+- Para evidências, inclua trechos curtos (até ~200 caracteres) copiados do texto.
+- Datas: quando possível, converta para AAAA-MM-DD.
+- Para o QSA (Quadro de Sócios e Administradores), extraia nome, CPF/CNPJ e qualificação de cada sócio.
+"""
 
 
 class EnderecoEstabelecimento(BaseModel):
@@ -47,6 +53,8 @@ class EnderecoEstabelecimento(BaseModel):
         description="CEP no formato 00000-000 (se disponível).",
     )
 
+    model_config = ConfigDict(frozen=True)
+
 
 class CNAE(BaseModel):
     codigo: str | None = Field(
@@ -58,6 +66,8 @@ class CNAE(BaseModel):
         description="Descrição do CNAE (se disponível).",
     )
 
+    model_config = ConfigDict(frozen=True)
+
 
 class SocioQSA(BaseModel):
     """Sócio/Administrador do Quadro de Sócios e Administradores (QSA)."""
@@ -74,6 +84,8 @@ class SocioQSA(BaseModel):
         description="Qualificação do sócio (ex: 49-Sócio-Administrador, 22-Sócio).",
     )
 
+    model_config = ConfigDict(frozen=True)
+
 
 class CartaoCNPJData(BaseModel):
     cnpj: str | None = Field(
@@ -121,6 +133,8 @@ class CartaoCNPJData(BaseModel):
         description="Quadro de Sócios e Administradores (QSA) - lista de sócios/administradores.",
     )
 
+    model_config = ConfigDict(frozen=True)
+
 
 class CartaoCNPJExtractionResult(BaseModel):
     data: CartaoCNPJData = Field(
@@ -146,89 +160,17 @@ class CartaoCNPJExtractionResult(BaseModel):
     )
 
 
-class CartaoCNPJExtractorState(TypedDict):
-    extracted_text: str
-    result: CartaoCNPJExtractionResult | None
-
-
-async def cartao_cnpj_extractor_node(
-    state: CartaoCNPJExtractorState,
-    config: RunnableConfig,
-) -> CartaoCNPJExtractorState:
-    extracted_text = state["extracted_text"]
-    correlation_id = (config.get("metadata") or {}).get("correlation_id")
+_extractor = StructuredExtractor(
+    result_schema=CartaoCNPJExtractionResult,
+    system_prompt=SYSTEM_PROMPT,
+    user_prompt_header="Texto extraído do Cartão CNPJ (pode estar parcial):",
+    document_type=enums.DocumentType.CARTAO_CNPJ,
+    extractor_name="CartaoCNPJExtractor",
+    display_name="Cartão CNPJ",
+)
 
-    llm = build_llm(correlation_id=correlation_id)
-    llm_structured = llm.with_structured_output(
-        CartaoCNPJExtractionResult, method="function_calling"
-    )
-
-    system = SystemMessage(
-        content="""Você é um assistente especializado em extrair dados estruturados de CARTÃO CNPJ (Comprovante de Inscrição e de Situação Cadastral) da Receita Federal do Brasil.
-
-Extraia os campos solicitados do texto fornecido.
-
-Regras:
-- Responda APENAS no formato estruturado solicitado.
-- Se algum campo não existir no texto, use null (ou lista vazia, quando aplicável).
-- NÃO invente valores. Se estiver incerto, reduza a confidence e descreva em notes.
-- Para evidências, inclua trechos curtos (até ~200 caracteres) copiados do texto.
-- Datas: quando possível, converta para AAAA-MM-DD.
-- Para o QSA (Quadro de Sócios e Administradores), extraia nome, CPF/CNPJ e qualificação de cada sócio.
-"""
-    )
-
-    user_content = f"""Texto extraído do Cartão CNPJ (pode estar parcial):
-{extracted_text}
-"""
-    result = await llm_structured.ainvoke(
-        [
-            system,
-            {"role": "user", "content": user_content},
-        ]
-    )
-    return {**state, "result": result}
-
-
-def build_cartao_cnpj_extractor_graph():
-    graph = StateGraph(CartaoCNPJExtractorState)
-    graph.add_node("extract", cartao_cnpj_extractor_node)
-    graph.set_entry_point("extract")
-    graph.add_edge("extract", END)
-    return graph.compile()
-
-
-async def extract_cartao_cnpj(
-    *,
-    extracted_text: str,
-    correlation_id: str | None = None,
-) -> CartaoCNPJExtractionResult:
-    app = build_cartao_cnpj_extractor_graph()
-    config = build_runnable_config(correlation_id)
-
-    try:
-        final_state = await app.ainvoke(
-            {
-                "extracted_text": extracted_text,
-                "result": None,
-            },
-            config=config,
-        )
-    except Exception as e:
-        logger.exception(
-            "LLM service error during Cartão CNPJ extraction",
-            extra={"correlation_id": correlation_id},
-        )
-        raise LLMServiceError(
-            "Failed to invoke LLM for Cartão CNPJ extraction",
-            original_error=e,
-        ) from e
-
-    result = final_state.get("result")
-    if result is None:
-        raise LLMExtractionError(
-            "Cartão CNPJ extraction did not produce a result",
-            extractor_name="CartaoCNPJExtractor",
-            document_type="CARTAO_CNPJ",
-        )
-    return result
+cartao_cnpj_extractor_node = _extractor.node
+build_cartao_cnpj_extractor_graph = _extractor.build_graph
+extract_cartao_cnpj = _extractor.extract
+extract_cartao_cnpj_batch = _extractor.extract_batch
+stream_cartao_cnpj = _extractor.stream
@@ -2,14 +2,23 @@ from __future__ import annotations
 
 from datetime import date
 
-from langchain_core.messages import SystemMessage
-from langchain_core.runnables import RunnableConfig
-from langgraph.graph import END, StateGraph
-from pydantic import BaseModel, Field
-from typing_extensions import TypedDict
+from pydantic import BaseModel, ConfigDict, Field
 
-from src.core.base.agents import build_llm, build_runnable_config, truncate_text
-from src.exceptions import LLMExtractionError, LLMServiceError
+from src import enums
+from src.agents.structured_extractor import StructuredExtractor
+
+SYSTEM_PROMPT = """Você é um assistente especializado em extrair dados estruturados de CERTIDÃO NEGATIVA FEDERAL.
+
+O documento costuma ser emitido pela Receita Federal do Brasil e/ou PGFN e comprova regularidade fiscal.
+Extraia os campos solicitados do texto fornecido.
+
+Regras:
+- Responda APENAS no formato estruturado solicitado.
+- Se algum campo não existir no texto, use null (ou lista vazia, quando aplicável).
+- NÃO invente valores. Se estiver incerto, reduza a confidence e descreva em notes.
+- Para evidências, inclua trechos curtos (até ~200 caracteres) copiados do texto.
+- Datas: quando possível, converta para AAAA-MM-DD.
+"""
 
 
 class CertidaoNegativaFederalData(BaseModel):
@@ -60,6 +69,8 @@ class CertidaoNegativaFederalData(BaseModel):
         description="Observações relevantes do documento (se disponível).",
     )
 
+    model_config = ConfigDict(frozen=True)
+
 
 class CertidaoNegativaFederalExtractionResult(BaseModel):
     data: CertidaoNegativaFederalData = Field(
@@ -84,95 +95,17 @@ class CertidaoNegativaFederalExtractionResult(BaseModel):
     )
 
 
-class CertidaoNegativaFederalExtractorState(TypedDict):
-    extracted_text: str
-    result: CertidaoNegativaFederalExtractionResult | None
-
-
-async def certidao_negativa_federal_extractor_node(
-    state: CertidaoNegativaFederalExtractorState,
-    config: RunnableConfig,
-) -> CertidaoNegativaFederalExtractorState:
-    extracted_text = truncate_text(state["extracted_text"])
-    correlation_id = (config.get("metadata") or {}).get("correlation_id")
-
-    llm = build_llm(correlation_id=correlation_id)
-    llm_structured = llm.with_structured_output(
-        CertidaoNegativaFederalExtractionResult, method="function_calling"
-    )
-
-    system = SystemMessage(
-        content="""Você é um assistente especializado em extrair dados estruturados de CERTIDÃO NEGATIVA FEDERAL.
-
-O documento costuma ser emitido pela Receita Federal do Brasil e/ou PGFN e comprova regularidade fiscal.
-Extraia os campos solicitados do texto fornecido.
-
-Regras:
-- Responda APENAS no formato estruturado solicitado.
-- Se algum campo não existir no texto, use null (ou lista vazia, quando aplicável).
-- NÃO invente valores. Se estiver incerto, reduza a confidence e descreva em notes.
-- Para evidências, inclua trechos curtos (até ~200 caracteres) copiados do texto.
-- Datas: quando possível, converta para AAAA-MM-DD.
-"""
-    )
-
-    user_content = f"""Texto extraído da Certidão Negativa Federal (pode estar parcial):
-{extracted_text}
-"""
-
-    result = await llm_structured.ainvoke(
-        [
-            system,
-            {"role": "user", "content": user_content},
-        ]
-    )
-
-    return {**state, "result": result}
-
-
-def build_certidao_negativa_federal_extractor_graph():
-    graph = StateGraph(CertidaoNegativaFederalExtractorState)
-    graph.add_node("extract", certidao_negativa_federal_extractor_node)
-    graph.set_entry_point("extract")
-    graph.add_edge("extract", END)
-    return graph.compile()
-
-
-async def extract_certidao_negativa_federal(
-    *,
-    extracted_text: str,
-    correlation_id: str | None = None,
-) -> CertidaoNegativaFederalExtractionResult:
-    import logging
-
-    logger = logging.getLogger(__name__)
-
-    app = build_certidao_negativa_federal_extractor_graph()
-    config = build_runnable_config(correlation_id)
-
-    try:
-        final_state = await app.ainvoke(
-            {
-                "extracted_text": extracted_text,
-                "result": None,
-            },
-            config=config,
-        )
-    except Exception as e:
-        logger.exception(
-            "LLM service error during Certidão Negativa Federal extraction",
-            extra={"correlation_id": correlation_id},
-        )
-        raise LLMServiceError(
-            "Failed to invoke LLM for Certidão Negativa Federal extraction",
-            original_error=e,
-        ) from e
+_extractor = StructuredExtractor(
+    result_schema=CertidaoNegativaFederalExtractionResult,
+    system_prompt=SYSTEM_PROMPT,
+    user_prompt_header="Texto extraído da Certidão Negativa Federal (pode estar parcial):",
+    document_type=enums.DocumentType.CERTIDAO_NEGATIVA,
+    extractor_name="CertidaoNegativaFederalExtractor",
+    display_name="Certidão Negativa Federal",
+)
 
-    result = final_state.get("result")
-    if result is None:
-        raise LLMExtractionError(
-            "Certidão Negativa Federal extraction did not produce a result",
-            extractor_name="CertidaoNegativaFederalExtractor",
-            document_type="CERTIDAO_NEGATIVA",
-        )
-    return result
+certidao_negativa_federal_extractor_node = _extractor.node
+build_certidao_negativa_federal_extractor_graph = _extractor.build_graph
+extract_certidao_negativa_federal = _extractor.extract
+extract_certidao_negativa_federal_batch = _extractor.extract_batch
+stream_certidao_negativa_federal = _extractor.stream
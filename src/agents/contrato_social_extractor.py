@@ -2,14 +2,22 @@ from __future__ import annotations
 
 from datetime import date
 
-from langchain_core.messages import SystemMessage
-from langchain_core.runnables import RunnableConfig
-from langgraph.graph import END, StateGraph
-from pydantic import BaseModel, Field
-from typing_extensions import TypedDict
+from pydantic import BaseModel, ConfigDict, Field
 
-from src.core.base.agents import build_llm, build_runnable_config, truncate_text
-from src.exceptions import LLMExtractionError, LLMServiceError
+from src import enums
+from src.agents.structured_extractor import StructuredExtractor
+
+SYSTEM_PROMPT = """Você é um assistente especializado em extrair dados estruturados de CONTRATO SOCIAL (sociedade empresária limitada) no Brasil.
+
+Extraia os campos solicitados do texto fornecido.
+
+Regras:
+- Responda APENAS no formato estruturado solicitado.
+- Se algum campo não existir no texto, use null (ou lista vazia, quando aplicável).
+- NÃO invente valores. Se estiver incerto, reduza a confidence e descreva em notes.
+- Para evidências, inclua trechos curtos (até ~200 caracteres) copiados do texto.
+- Datas: quando possível, converta para AAAA-MM-DD.
+"""
 
 
 class Endereco(BaseModel):
@@ -44,6 +52,8 @@ class Endereco(BaseModel):
         description="CEP no formato 00000-000 (se disponível).",
     )
 
+    model_config = ConfigDict(frozen=True)
+
 
 class Socio(BaseModel):
     nome: str = Field(
@@ -78,6 +88,8 @@ class Socio(BaseModel):
         description="Endereço residencial (se disponível).",
     )
 
+    model_config = ConfigDict(frozen=True)
+
 
 class ContratoSocialData(BaseModel):
     razao_social: str | None = Field(
@@ -113,6 +125,8 @@ class ContratoSocialData(BaseModel):
         description="Lista de sócios identificados no contrato.",
     )
 
+    model_config = ConfigDict(frozen=True)
+
 
 class ContratoSocialExtractionResult(BaseModel):
     data: ContratoSocialData = Field(
@@ -136,94 +150,17 @@ class ContratoSocialExtractionResult(BaseModel):
     )
 
 
-class ContratoSocialExtractorState(TypedDict):
-    extracted_text: str
-    result: ContratoSocialExtractionResult | None
-
-
-async def contrato_social_extractor_node(
-    state: ContratoSocialExtractorState,
-    config: RunnableConfig,
-) -> ContratoSocialExtractorState:
-    extracted_text = truncate_text(state["extracted_text"])
-    correlation_id = (config.get("metadata") or {}).get("correlation_id")
-
-    llm = build_llm(correlation_id=correlation_id)
-    llm_structured = llm.with_structured_output(
-        ContratoSocialExtractionResult, method="function_calling"
-    )
-
-    system = SystemMessage(
-        content="""Você é um assistente especializado em extrair dados estruturados de CONTRATO SOCIAL (sociedade empresária limitada) no Brasil.
-
-Extraia os campos solicitados do texto fornecido.
-
-Regras:
-- Responda APENAS no formato estruturado solicitado.
-- Se algum campo não existir no texto, use null (ou lista vazia, quando aplicável).
-- NÃO invente valores. Se estiver incerto, reduza a confidence e descreva em notes.
-- Para evidências, inclua trechos curtos (até ~200 caracteres) copiados do texto.
-- Datas: quando possível, converta para AAAA-MM-DD.
-"""
-    )
-
-    user_content = f"""Texto extraído do contrato social (pode estar parcial):
-{extracted_text}
-"""
+_extractor = StructuredExtractor(
+    result_schema=ContratoSocialExtractionResult,
+    system_prompt=SYSTEM_PROMPT,
+    user_prompt_header="Texto extraído do contrato social (pode estar parcial):",
+    document_type=enums.DocumentType.CONTRATO_SOCIAL,
+    extractor_name="ContratoSocialExtractor",
+    display_name="Contrato Social",
+)
 
-    result = await llm_structured.ainvoke(
-        [
-            system,
-            {"role": "user", "content": user_content},
-        ]
-    )
-
-    return {**state, "result": result}
-
-
-def build_contrato_social_extractor_graph():
-    graph = StateGraph(ContratoSocialExtractorState)
-    graph.add_node("extract", contrato_social_extractor_node)
-    graph.set_entry_point("extract")
-    graph.add_edge("extract", END)
-    return graph.compile()
-
-
-async def extract_contrato_social(
-    *,
-    extracted_text: str,
-    correlation_id: str | None = None,
-) -> ContratoSocialExtractionResult:
-    import logging
-
-    logger = logging.getLogger(__name__)
-
-    app = build_contrato_social_extractor_graph()
-    config = build_runnable_config(correlation_id)
-
-    try:
-        final_state = await app.ainvoke(
-            {
-                "extracted_text": extracted_text,
-                "result": None,
-            },
-            config=config,
-        )
-    except Exception as e:
-        logger.exception(
-            "LLM service error during Contrato Social extraction",
-            extra={"correlation_id": correlation_id},
-        )
-        raise LLMServiceError(
-            "Failed to invoke LLM for Contrato Social extraction",
-            original_error=e,
-        ) from e
-
-    result = final_state.get("result")
-    if result is None:
-        raise LLMExtractionError(
-            "Contrato Social extraction did not produce a result",
-            extractor_name="ContratoSocialExtractor",
-            document_type="CONTRATO_SOCIAL",
-        )
-    return result
+contrato_social_extractor_node = _extractor.node
+build_contrato_social_extractor_graph = _extractor.build_graph
+extract_contrato_social = _extractor.extract
+extract_contrato_social_batch = _extractor.extract_batch
+stream_contrato_social = _extractor.stream
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import functools
+import logging
+import re
+import typing as tp
 from datetime import date
 
-from dateutil.relativedelta import relativedelta
 from langchain_core.messages import SystemMessage
 from langchain_core.runnables import RunnableConfig
 from langgraph.graph import END, StateGraph
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from typing_extensions import TypedDict
 
 from src import enums
@@ -22,9 +25,35 @@ from src.agents.contrato_social_extractor import (
     ContratoSocialData,
     ContratoSocialExtractionResult,
 )
-from src.core.base.agents import build_llm, build_runnable_config
+from src.core.base.agents import build_runnable_config, get_llm
+from src.core.types import DictStrAny
+from src.core.utils.datetime import subtract_months
 from src.exceptions import LLMExtractionError, LLMServiceError
 
+logger = logging.getLogger(__name__)
+
+SYSTEM_PROMPT = """
+Você é um analista jurídico especializado em validação de documentos empresariais.
+
+Você recebeu os dados extraídos de três documentos de uma empresa:
+- Contrato Social
+- Cartão CNPJ
+- Certidão Negativa de Débitos Federais
+
+Também recebeu uma lista de inconsistências encontradas na validação cruzada.
+
+Sua tarefa é gerar um RESUMO EXECUTIVO claro e objetivo para o time jurídico,
+explicando:
+1. Se os documentos estão consistentes ou não
+2. Quais problemas foram encontrados (se houver)
+3. A decisão final (APROVADO ou REPROVADO)
+
+Seja direto e profissional. Máximo de 3-4 frases.
+"""
+
+# Built once; messages are immutable inputs and safe to share across calls
+SYSTEM_MESSAGE = SystemMessage(content=SYSTEM_PROMPT)
+
 
 class Inconsistency(BaseModel):
     code: str = Field(
@@ -68,6 +97,10 @@ class CrossDocumentAnalysisResult(BaseModel):
     )
 
 
+# Serializes the inconsistencies for the summary prompt in a single call
+_INCONSISTENCIES_ADAPTER = TypeAdapter(list[Inconsistency])
+
+
 class CrossDocumentAnalyzerState(TypedDict):
     # Inputs
     contrato_social: ContratoSocialData | None
@@ -85,19 +118,32 @@ class CrossDocumentAnalyzerState(TypedDict):
     result: CrossDocumentAnalysisResult | None
 
 
+# Acentos comuns em nomes brasileiros
+_ACCENT_TABLE = str.maketrans("áàãâéêíóôõúüç", "aaaaeeiooouuc")
+
+_NON_DIGITS = re.compile(r"\D+")
+
+# As normalizações são puras e recebem os mesmos valores repetidamente (na
+# mesma análise e entre análises da mesma empresa), então são memoizadas
+_NORMALIZE_CACHE_SIZE = 2048
+
+
+@functools.lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def _normalize_cnpj(cnpj: str | None) -> str:
     if not cnpj:
         return ""
-    return "".join(c for c in cnpj if c.isdigit())
+    return _NON_DIGITS.sub("", cnpj)
 
 
+@functools.lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def _normalize_cpf(cpf: str | None) -> str:
     """Normaliza CPF: remove pontuação, mantém apenas dígitos."""
     if not cpf:
         return ""
-    return "".join(c for c in cpf if c.isdigit())
+    return _NON_DIGITS.sub("", cpf)
 
 
+@functools.lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def _normalize_text(text: str | None) -> str:
     """Normaliza texto: lowercase, whitespace unificado."""
     if not text:
@@ -105,87 +151,82 @@ def _normalize_text(text: str | None) -> str:
     return " ".join(text.lower().split())
 
 
+@functools.lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def _normalize_name(name: str | None) -> str:
     """Normaliza nome: lowercase, remove acentos comuns, whitespace unificado."""
     if not name:
         return ""
     # Normalização básica
     normalized = " ".join(name.lower().split())
-    # Remove acentos comuns em nomes brasileiros
-    replacements = {
-        "á": "a", "à": "a", "ã": "a", "â": "a",
-        "é": "e", "ê": "e",
-        "í": "i",
-        "ó": "o", "ô": "o", "õ": "o",
-        "ú": "u", "ü": "u",
-        "ç": "c",
-    }
-    for old, new in replacements.items():
-        normalized = normalized.replace(old, new)
-    return normalized
+    # Nomes já sem acentos dispensam a tradução
+    if normalized.isascii():
+        return normalized
+    return normalized.translate(_ACCENT_TABLE)
 
 
-async def deterministic_checks_node(
-    state: CrossDocumentAnalyzerState,
-) -> CrossDocumentAnalyzerState:
-    contrato = state["contrato_social"]
-    cartao = state["cartao_cnpj"]
-    certidao = state["certidao_negativa"]
-    reference_date = state.get("reference_date") or date.today()
+def _find_divergences(
+    values: list[tuple[str, str]],
+    *,
+    code: str,
+    field: str,
+    label: str,
+) -> list[Inconsistency]:
+    """Compara o valor de cada documento com o do primeiro documento disponível."""
+    if len(values) < 2:
+        return []
+
+    ref_doc, ref_value = values[0]
+    return [
+        Inconsistency.model_construct(
+            code=code,
+            severity=enums.InconsistencySeverity.BLOCKER,
+            message=f"{label} divergente entre {ref_doc} e {doc}.",
+            field=field,
+            documents=[ref_doc, doc],
+            values=[ref_value, value],
+        )
+        for doc, value in values[1:]
+        if value != ref_value
+    ]
 
-    inconsistencies: list[Inconsistency] = []
 
-    # --- CNPJ ---
+def _check_cnpj_and_razao_social(
+    documents: tp.Iterable[tuple[str, tp.Any]],
+) -> list[Inconsistency]:
+    """Compara CNPJ e razão social, coletados em uma única passada pelos documentos."""
     cnpjs: list[tuple[str, str]] = []
-    if contrato and contrato.cnpj:
-        cnpjs.append(("CONTRATO_SOCIAL", _normalize_cnpj(contrato.cnpj)))
-    if cartao and cartao.cnpj:
-        cnpjs.append(("CARTAO_CNPJ", _normalize_cnpj(cartao.cnpj)))
-    if certidao and certidao.cnpj:
-        cnpjs.append(("CERTIDAO_NEGATIVA", _normalize_cnpj(certidao.cnpj)))
-
-    if len(cnpjs) >= 2:
-        ref_doc, ref_cnpj = cnpjs[0]
-        for doc, cnpj in cnpjs[1:]:
-            if cnpj != ref_cnpj:
-                inconsistencies.append(
-                    Inconsistency(
-                        code="cnpj_mismatch",
-                        severity=enums.InconsistencySeverity.BLOCKER,
-                        message=f"CNPJ divergente entre {ref_doc} e {doc}.",
-                        field="cnpj",
-                        documents=[ref_doc, doc],
-                        values=[ref_cnpj, cnpj],
-                    )
-                )
-
     razoes: list[tuple[str, str]] = []
-    if contrato and contrato.razao_social:
-        razoes.append(("CONTRATO_SOCIAL", _normalize_text(contrato.razao_social)))
-    if cartao and cartao.razao_social:
-        razoes.append(("CARTAO_CNPJ", _normalize_text(cartao.razao_social)))
-    if certidao and certidao.razao_social:
-        razoes.append(("CERTIDAO_NEGATIVA", _normalize_text(certidao.razao_social)))
-
-    if len(razoes) >= 2:
-        ref_doc, ref_razao = razoes[0]
-        for doc, razao in razoes[1:]:
-            if razao != ref_razao:
-                inconsistencies.append(
-                    Inconsistency(
-                        code="razao_social_mismatch",
-                        severity=enums.InconsistencySeverity.BLOCKER,
-                        message=f"Razão social divergente entre {ref_doc} e {doc}.",
-                        field="razao_social",
-                        documents=[ref_doc, doc],
-                        values=[ref_razao, razao],
-                    )
-                )
+    for doc_name, doc in documents:
+        if doc is None:
+            continue
+        if doc.cnpj:
+            cnpjs.append((doc_name, _normalize_cnpj(doc.cnpj)))
+        if doc.razao_social:
+            razoes.append((doc_name, _normalize_text(doc.razao_social)))
+
+    return [
+        *_find_divergences(cnpjs, code="cnpj_mismatch", field="cnpj", label="CNPJ"),
+        *_find_divergences(
+            razoes,
+            code="razao_social_mismatch",
+            field="razao_social",
+            label="Razão social",
+        ),
+    ]
+
+
+def _check_dates(
+    cartao: CartaoCNPJData | None,
+    certidao: CertidaoNegativaFederalData | None,
+    reference_date: date,
+) -> list[Inconsistency]:
+    """Valida a validade da certidão e a idade dos documentos (máximo 6 meses)."""
+    inconsistencies: list[Inconsistency] = []
 
     if certidao and certidao.data_validade:
         if certidao.data_validade < reference_date:
             inconsistencies.append(
-                Inconsistency(
+                Inconsistency.model_construct(
                     code="certificate_expired",
                     severity=enums.InconsistencySeverity.BLOCKER,
                     message=f"Certidão negativa vencida (validade: {certidao.data_validade}).",
@@ -195,13 +236,12 @@ async def deterministic_checks_node(
                 )
             )
 
-    # --- Validação de 6 meses (documentos não podem ter mais de 6 meses) ---
-    six_months_ago = reference_date - relativedelta(months=6)
+    six_months_ago = subtract_months(reference_date, 6)
 
     if certidao and certidao.data_emissao:
         if certidao.data_emissao < six_months_ago:
             inconsistencies.append(
-                Inconsistency(
+                Inconsistency.model_construct(
                     code="document_older_than_6_months",
                     severity=enums.InconsistencySeverity.BLOCKER,
                     message=(
@@ -217,7 +257,7 @@ async def deterministic_checks_node(
     if cartao and cartao.data_situacao_cadastral:
         if cartao.data_situacao_cadastral < six_months_ago:
             inconsistencies.append(
-                Inconsistency(
+                Inconsistency.model_construct(
                     code="document_older_than_6_months",
                     severity=enums.InconsistencySeverity.WARN,
                     message=(
@@ -230,90 +270,122 @@ async def deterministic_checks_node(
                 )
             )
 
-    if contrato and contrato.sede and cartao and cartao.endereco_estabelecimento:
-        sede = contrato.sede
-        endereco = cartao.endereco_estabelecimento
-        cidade_contrato = _normalize_text(sede.cidade)
-        uf_contrato = _normalize_text(sede.uf)
-        cidade_cartao = _normalize_text(endereco.municipio)
-        uf_cartao = _normalize_text(endereco.uf)
-
-        if cidade_contrato and cidade_cartao:
-            if cidade_contrato != cidade_cartao or uf_contrato != uf_cartao:
-                inconsistencies.append(
-                    Inconsistency(
-                        code="endereco_mismatch",
-                        severity=enums.InconsistencySeverity.WARN,
-                        message=(
-                            f"Endereço divergente entre Contrato Social "
-                            f"({cidade_contrato}/{uf_contrato}) e Cartão CNPJ "
-                            f"({cidade_cartao}/{uf_cartao})."
-                        ),
-                        field="endereco",
-                        documents=["CONTRATO_SOCIAL", "CARTAO_CNPJ"],
-                        values=[
-                            f"{cidade_contrato}/{uf_contrato}",
-                            f"{cidade_cartao}/{uf_cartao}",
-                        ],
-                    )
+    return inconsistencies
+
+
+def _check_endereco(
+    contrato: ContratoSocialData | None,
+    cartao: CartaoCNPJData | None,
+) -> list[Inconsistency]:
+    """Compara cidade/UF da sede do Contrato Social com o endereço do Cartão CNPJ."""
+    if not (contrato and contrato.sede and cartao and cartao.endereco_estabelecimento):
+        return []
+
+    sede = contrato.sede
+    endereco = cartao.endereco_estabelecimento
+    cidade_contrato = _normalize_text(sede.cidade)
+    uf_contrato = _normalize_text(sede.uf)
+    cidade_cartao = _normalize_text(endereco.municipio)
+    uf_cartao = _normalize_text(endereco.uf)
+
+    if not (cidade_contrato and cidade_cartao):
+        return []
+    if cidade_contrato == cidade_cartao and uf_contrato == uf_cartao:
+        return []
+
+    return [
+        Inconsistency.model_construct(
+            code="endereco_mismatch",
+            severity=enums.InconsistencySeverity.WARN,
+            message=(
+                f"Endereço divergente entre Contrato Social "
+                f"({cidade_contrato}/{uf_contrato}) e Cartão CNPJ "
+                f"({cidade_cartao}/{uf_cartao})."
+            ),
+            field="endereco",
+            documents=["CONTRATO_SOCIAL", "CARTAO_CNPJ"],
+            values=[
+                f"{cidade_contrato}/{uf_contrato}",
+                f"{cidade_cartao}/{uf_cartao}",
+            ],
+        )
+    ]
+
+
+def _check_socios(
+    contrato: ContratoSocialData | None,
+    cartao: CartaoCNPJData | None,
+) -> list[Inconsistency]:
+    """Compara o CPF dos sócios do Contrato Social com o QSA do Cartão CNPJ."""
+    if not (contrato and contrato.socios and cartao and cartao.qsa):
+        return []
+
+    # Criar dicionário de sócios do contrato: nome normalizado -> cpf normalizado
+    contrato_socios: dict[str, str] = {}
+    # Nome original (primeira ocorrência) para mensagens legíveis
+    nomes_originais: dict[str, str] = {}
+    for socio in contrato.socios:
+        if socio.nome and socio.cpf:
+            nome_norm = _normalize_name(socio.nome)
+            cpf_norm = _normalize_cpf(socio.cpf)
+            contrato_socios[nome_norm] = cpf_norm
+            nomes_originais.setdefault(nome_norm, socio.nome)
+
+    # Criar dicionário de sócios do QSA: nome normalizado -> cpf normalizado
+    qsa_socios: dict[str, str] = {}
+    for socio in cartao.qsa:
+        if socio.nome and socio.cpf_cnpj:
+            nome_norm = _normalize_name(socio.nome)
+            cpf_norm = _normalize_cpf(socio.cpf_cnpj)
+            qsa_socios[nome_norm] = cpf_norm
+
+    # Comparar CPFs de sócios com mesmo nome (match exato após normalização)
+    inconsistencies: list[Inconsistency] = []
+    for nome_contrato, cpf_contrato in contrato_socios.items():
+        cpf_qsa = qsa_socios.get(nome_contrato)
+        if cpf_qsa is not None and cpf_contrato != cpf_qsa:
+            inconsistencies.append(
+                Inconsistency.model_construct(
+                    code="socio_cpf_mismatch",
+                    severity=enums.InconsistencySeverity.BLOCKER,
+                    message=(
+                        f"CPF divergente para o sócio "
+                        f"'{nomes_originais[nome_contrato]}' "
+                        f"entre Contrato Social e Cartão CNPJ."
+                    ),
+                    field="socio_cpf",
+                    documents=["CONTRATO_SOCIAL", "CARTAO_CNPJ"],
+                    values=[cpf_contrato, cpf_qsa],
                 )
+            )
+    return inconsistencies
 
-    # --- Validação de CPF dos sócios (Contrato Social vs Cartão CNPJ QSA) ---
-    if contrato and contrato.socios and cartao and cartao.qsa:
-        # Criar dicionário de sócios do contrato: nome normalizado -> cpf normalizado
-        contrato_socios: dict[str, str] = {}
-        for socio in contrato.socios:
-            if socio.nome and socio.cpf:
-                nome_norm = _normalize_name(socio.nome)
-                cpf_norm = _normalize_cpf(socio.cpf)
-                contrato_socios[nome_norm] = cpf_norm
-
-        # Criar dicionário de sócios do QSA: nome normalizado -> cpf normalizado
-        qsa_socios: dict[str, str] = {}
-        for socio in cartao.qsa:
-            if socio.nome and socio.cpf_cnpj:
-                nome_norm = _normalize_name(socio.nome)
-                cpf_norm = _normalize_cpf(socio.cpf_cnpj)
-                qsa_socios[nome_norm] = cpf_norm
-
-        # Comparar CPFs de sócios com mesmo nome
-        for nome_contrato, cpf_contrato in contrato_socios.items():
-            for nome_qsa, cpf_qsa in qsa_socios.items():
-                # Verifica se os nomes são similares (match exato após normalização)
-                if nome_contrato == nome_qsa:
-                    if cpf_contrato != cpf_qsa:
-                        # Encontrar nome original para mensagem legível
-                        nome_original = next(
-                            (s.nome for s in contrato.socios
-                             if _normalize_name(s.nome) == nome_contrato),
-                            nome_contrato
-                        )
-                        inconsistencies.append(
-                            Inconsistency(
-                                code="socio_cpf_mismatch",
-                                severity=enums.InconsistencySeverity.BLOCKER,
-                                message=(
-                                    f"CPF divergente para o sócio '{nome_original}' "
-                                    f"entre Contrato Social e Cartão CNPJ."
-                                ),
-                                field="socio_cpf",
-                                documents=["CONTRATO_SOCIAL", "CARTAO_CNPJ"],
-                                values=[cpf_contrato, cpf_qsa],
-                            )
-                        )
-
-    return {**state, "inconsistencies": inconsistencies}
-
-
-async def make_decision_node(
-    state: CrossDocumentAnalyzerState,
-) -> CrossDocumentAnalyzerState:
+
+def run_deterministic_checks(state: CrossDocumentAnalyzerState) -> DictStrAny:
+    """Run every deterministic check and decide, without touching the event loop."""
     contrato = state["contrato_social"]
     cartao = state["cartao_cnpj"]
     certidao = state["certidao_negativa"]
-    inconsistencies = state.get("inconsistencies") or []
+    reference_date = state.get("reference_date") or date.today()
 
-    # Decisão
+    documents = (
+        ("CONTRATO_SOCIAL", contrato),
+        ("CARTAO_CNPJ", cartao),
+        ("CERTIDAO_NEGATIVA", certidao),
+    )
+
+    # As verificações são independentes e puramente em memória, então rodam em
+    # sequência: agendá-las como tarefas só adicionaria overhead. As
+    # inconsistências são montadas a partir de valores já normalizados e
+    # tipados, então `model_construct` dispensa a validação
+    inconsistencies: list[Inconsistency] = [
+        *_check_cnpj_and_razao_social(documents),
+        *_check_dates(cartao, certidao, reference_date),
+        *_check_endereco(contrato, cartao),
+        *_check_socios(contrato, cartao),
+    ]
+
+    # --- Decisão ---
     has_blocker = any(
         inc.severity == enums.InconsistencySeverity.BLOCKER for inc in inconsistencies
     )
@@ -324,61 +396,55 @@ async def make_decision_node(
     )
 
     # Confiança baseada em dados disponíveis
-    docs_available = sum(1 for doc in [contrato, cartao, certidao] if doc is not None)
+    docs_available = sum(1 for _, doc in documents if doc is not None)
     base_confidence = docs_available / 3.0
     # Penalidade por inconsistências
     penalty = len(inconsistencies) * 0.1
     confidence = max(0.0, min(1.0, base_confidence - penalty))
 
-    return {**state, "decision": decision, "confidence": confidence}
+    # LangGraph merges the returned keys into the state
+    return {
+        "inconsistencies": inconsistencies,
+        "decision": decision,
+        "confidence": confidence,
+    }
+
+
+async def deterministic_checks_node(
+    state: CrossDocumentAnalyzerState,
+) -> DictStrAny:
+    # Kept async so LangGraph calls it inline on the loop instead of
+    # dispatching a sync node to its thread pool
+    return run_deterministic_checks(state)
 
 
 async def generate_summary_node(
     state: CrossDocumentAnalyzerState,
     config: RunnableConfig,
-) -> CrossDocumentAnalyzerState:
+) -> DictStrAny:
     contrato = state["contrato_social"]
     cartao = state["cartao_cnpj"]
     certidao = state["certidao_negativa"]
     inconsistencies = state.get("inconsistencies") or []
     decision = state.get("decision")
-    correlation_id = (config.get("metadata") or {}).get("correlation_id")
-
-    llm = build_llm(correlation_id=correlation_id)
-
-    system_prompt = """
-Você é um analista jurídico especializado em validação de documentos empresariais.
-
-Você recebeu os dados extraídos de três documentos de uma empresa:
-- Contrato Social
-- Cartão CNPJ
-- Certidão Negativa de Débitos Federais
 
-Também recebeu uma lista de inconsistências encontradas na validação cruzada.
-
-Sua tarefa é gerar um RESUMO EXECUTIVO claro e objetivo para o time jurídico,
-explicando:
-1. Se os documentos estão consistentes ou não
-2. Quais problemas foram encontrados (se houver)
-3. A decisão final (APROVADO ou REPROVADO)
-
-Seja direto e profissional. Máximo de 3-4 frases.
-"""
+    # Shared model; tracing callbacks come from the graph's RunnableConfig
+    llm = get_llm()
 
     user_content = f"""
 ## Dados extraídos
 
 ### Contrato Social
-{contrato.model_dump_json(indent=2) if contrato else "Não fornecido"}
+{contrato.model_dump_json() if contrato else "Não fornecido"}
 
 ### Cartão CNPJ
-{cartao.model_dump_json(indent=2) if cartao else "Não fornecido"}
+{cartao.model_dump_json() if cartao else "Não fornecido"}
 
 ### Certidão Negativa Federal
-{certidao.model_dump_json(indent=2) if certidao else "Não fornecido"}
+{certidao.model_dump_json() if certidao else "Não fornecido"}
 
 ## Inconsistências encontradas
-{[inc.model_dump() for inc in inconsistencies] if inconsistencies else "Nenhuma inconsistência encontrada."}
+{_INCONSISTENCIES_ADAPTER.dump_json(inconsistencies).decode() if inconsistencies else "Nenhuma inconsistência encontrada."}
 
 ## Decisão
 {decision.value if decision else "INDEFINIDA"}
@@ -387,19 +453,19 @@ Seja direto e profissional. Máximo de 3-4 frases.
 """
 
     messages = [
-        SystemMessage(content=system_prompt),
+        SYSTEM_MESSAGE,
         {"role": "user", "content": user_content},
     ]
 
-    response = await llm.ainvoke(messages)
+    response = await llm.ainvoke(messages, config)
     summary = response.content.strip() if response.content else ""
 
-    return {**state, "summary": summary}
+    return {"summary": summary}
 
 
 async def build_result_node(
     state: CrossDocumentAnalyzerState,
-) -> CrossDocumentAnalyzerState:
+) -> DictStrAny:
     result = CrossDocumentAnalysisResult(
         decision=state["decision"] or enums.AnalysisDecision.REPROVADO,
         inconsistencies=state.get("inconsistencies") or [],
@@ -407,26 +473,37 @@ async def build_result_node(
         confidence=state.get("confidence") or 0.0,
     )
 
-    return {**state, "result": result}
+    return {"result": result}
 
 
 def build_cross_document_analyzer_graph():
     graph = StateGraph(CrossDocumentAnalyzerState)
 
     graph.add_node("deterministic_checks", deterministic_checks_node)
-    graph.add_node("make_decision", make_decision_node)
     graph.add_node("generate_summary", generate_summary_node)
     graph.add_node("build_result", build_result_node)
 
     graph.set_entry_point("deterministic_checks")
-    graph.add_edge("deterministic_checks", "make_decision")
-    graph.add_edge("make_decision", "generate_summary")
+    graph.add_edge("deterministic_checks", "generate_summary")
     graph.add_edge("generate_summary", "build_result")
     graph.add_edge("build_result", END)
 
     return graph.compile()
 
 
+@functools.lru_cache(maxsize=1)
+def _get_cross_document_analyzer_app():
+    # The topology is static and compiled graphs are safe to invoke concurrently
+    return build_cross_document_analyzer_graph()
+
+
+def _unwrap_data(value: tp.Any) -> tp.Any:
+    # Extract .data from ExtractionResult objects if needed. Duck-typed rather
+    # than isinstance for robustness with Jupyter autoreload (class identity
+    # changes when modules are reimported); data models have no `data` field
+    return getattr(value, "data", value)
+
+
 async def analyze_documents(
     *,
     contrato_social: ContratoSocialData | ContratoSocialExtractionResult | None = None,
@@ -437,31 +514,11 @@ async def analyze_documents(
     reference_date: date | None = None,
     correlation_id: str | None = None,
 ) -> CrossDocumentAnalysisResult:
-    # Extract .data from ExtractionResult objects if needed
-    # Using hasattr for robustness with Jupyter autoreload (isinstance can fail
-    # when modules are reimported because class identity changes)
-    contrato_data: ContratoSocialData | None = None
-    if contrato_social is not None:
-        if hasattr(contrato_social, "data") and hasattr(contrato_social, "confidence"):
-            contrato_data = contrato_social.data
-        else:
-            contrato_data = contrato_social
-
-    cartao_data: CartaoCNPJData | None = None
-    if cartao_cnpj is not None:
-        if hasattr(cartao_cnpj, "data") and hasattr(cartao_cnpj, "confidence"):
-            cartao_data = cartao_cnpj.data
-        else:
-            cartao_data = cartao_cnpj
-
-    certidao_data: CertidaoNegativaFederalData | None = None
-    if certidao_negativa is not None:
-        if hasattr(certidao_negativa, "data") and hasattr(certidao_negativa, "confidence"):
-            certidao_data = certidao_negativa.data
-        else:
-            certidao_data = certidao_negativa
-
-    app = build_cross_document_analyzer_graph()
+    contrato_data: ContratoSocialData | None = _unwrap_data(contrato_social)
+    cartao_data: CartaoCNPJData | None = _unwrap_data(cartao_cnpj)
+    certidao_data: CertidaoNegativaFederalData | None = _unwrap_data(certidao_negativa)
+
+    app = _get_cross_document_analyzer_app()
     config = build_runnable_config(correlation_id)
 
     initial_state: CrossDocumentAnalyzerState = {
@@ -476,10 +533,6 @@ async def analyze_documents(
         "result": None,
     }
 
-    import logging
-
-    logger = logging.getLogger(__name__)
-
     try:
         final_state = await app.ainvoke(initial_state, config=config)
     except Exception as e:
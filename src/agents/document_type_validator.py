@@ -1,18 +1,37 @@
 from __future__ import annotations
 
+from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import SystemMessage
-from langchain_core.runnables import RunnableConfig
+from langchain_core.output_parsers.openai_tools import PydanticToolsParser
+from langchain_core.runnables import Runnable, RunnableConfig
+from langchain_core.utils.function_calling import convert_to_openai_tool
 from langgraph.graph import END, StateGraph
 from pydantic import BaseModel, Field
 from typing_extensions import TypedDict
 
 from src import enums
 from src.core.base.agents import (
-    build_llm,
     build_runnable_config,
+    get_llm,
     limit_list,
     truncate_text,
 )
+from src.core.types import DictStrAny
+
+SYSTEM_PROMPT = """Você é um classificador de documentos empresariais/jurídicos brasileiros.
+
+Sua tarefa é classificar o texto fornecido em exatamente UM dos tipos abaixo:
+- CONTRATO_SOCIAL
+- CARTAO_CNPJ
+- CERTIDAO_NEGATIVA
+
+Regras:
+- Retorne apenas a saída estruturada solicitada.
+- Use evidências (trechos curtos) extraídas diretamente do texto fornecido.
+- Se o texto estiver incompleto ou ruim, ainda assim escolha o tipo mais provável e reduza a confiança.
+"""
+
+SYSTEM_MESSAGE = SystemMessage(content=SYSTEM_PROMPT)
 
 
 class DocumentTypeValidationResult(BaseModel):
@@ -61,37 +80,45 @@ class ClassifierOutput(BaseModel):
     rationale: str = Field(description="Short explanation of the classification.")
 
 
+# Equivalent to `with_structured_output(ClassifierOutput, method="function_calling")`
+# with the tool definition converted once at import time
+_CLASSIFIER_TOOL = convert_to_openai_tool(ClassifierOutput)
+_CLASSIFIER_PARSER = PydanticToolsParser(tools=[ClassifierOutput], first_tool_only=True)
+
+_structured_llm: tuple[BaseChatModel, Runnable] | None = None
+
+
+def _get_structured_llm() -> Runnable:
+    # Shared model; tracing callbacks come from the graph's RunnableConfig.
+    # Rebuilt only when the shared LLM changes (i.e. on a new event loop)
+    global _structured_llm
+    llm = get_llm()
+    if _structured_llm is None or _structured_llm[0] is not llm:
+        bound = llm.bind_tools(
+            [_CLASSIFIER_TOOL],
+            tool_choice=_CLASSIFIER_TOOL["function"]["name"],
+            parallel_tool_calls=False,
+            ls_structured_output_format={
+                "kwargs": {"method": "function_calling"},
+                "schema": _CLASSIFIER_TOOL,
+            },
+        )
+        _structured_llm = (llm, bound | _CLASSIFIER_PARSER)
+    return _structured_llm[1]
+
+
 async def document_type_validator_node(
     state: DocumentTypeValidationState,
     config: RunnableConfig,
-) -> DocumentTypeValidationState:
+) -> DictStrAny:
     expected_type = state["expected_type"]
     extracted_text = truncate_text(state["extracted_text"])
-    correlation_id = (config.get("metadata") or {}).get("correlation_id")
-
-    llm = build_llm(correlation_id=correlation_id)
-    llm_structured = llm.with_structured_output(
-        ClassifierOutput, method="function_calling"
-    )
-
-    system = SystemMessage(
-        content="""Você é um classificador de documentos empresariais/jurídicos brasileiros.
-
-Sua tarefa é classificar o texto fornecido em exatamente UM dos tipos abaixo:
-- CONTRATO_SOCIAL
-- CARTAO_CNPJ
-- CERTIDAO_NEGATIVA
 
-Regras:
-- Retorne apenas a saída estruturada solicitada.
-- Use evidências (trechos curtos) extraídas diretamente do texto fornecido.
-- Se o texto estiver incompleto ou ruim, ainda assim escolha o tipo mais provável e reduza a confiança.
-"""
-    )
+    llm_structured = _get_structured_llm()
 
     output = await llm_structured.ainvoke(
         [
-            system,
+            SYSTEM_MESSAGE,
             {
                 "role": "user",
                 "content": f"""Tipo esperado: {expected_type}
@@ -100,7 +127,8 @@ Texto extraído (pode estar parcial):
 {extracted_text}
 """,
             },
-        ]
+        ],
+        config,
     )
 
     result = DocumentTypeValidationResult(
@@ -112,7 +140,7 @@ Texto extraído (pode estar parcial):
         rationale=output.rationale,
     )
 
-    return {**state, "result": result}
+    return {"result": result}
 
 
 def build_document_type_validator_graph():
@@ -129,15 +157,16 @@ async def validate_document_type(
     extracted_text: str,
     correlation_id: str | None = None,
 ) -> DocumentTypeValidationResult:
-    app = build_document_type_validator_graph()
     config = build_runnable_config(correlation_id)
-    final_state = await app.ainvoke(
+    # A single-node graph only adds state plumbing, so the node is called
+    # directly; `build_document_type_validator_graph` remains available
+    final_state = await document_type_validator_node(
         {
             "expected_type": expected_type,
             "extracted_text": extracted_text,
             "result": None,
         },
-        config=config,
+        config,
     )
     result = final_state.get("result")
     if result is None:
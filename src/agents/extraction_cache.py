@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import logging
+import os
+import threading
+from pathlib import Path
+
+import orjson
+from pydantic import BaseModel, ValidationError
+
+from src.core.settings import get_settings
+from src.core.utils.datetime import now
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionCache:
+    """Content-addressable disk cache for structured extraction results.
+
+    Entries live at `{base_path}/{document_type}/{key}.json`, where the key is
+    the sha256 of the provider, model, prompt version and extracted text, so
+    changing any of them naturally misses the cache.
+    """
+
+    def __init__(self, base_path: Path) -> None:
+        self.base_path = base_path
+
+    @staticmethod
+    def compute_key(
+        *,
+        extracted_text: str,
+        provider: str,
+        model: str,
+        prompt_version: str,
+    ) -> str:
+        hasher = hashlib.sha256()
+        for part in (provider, model, prompt_version):
+            hasher.update(part.encode("utf-8"))
+            hasher.update(b"\0")
+        hasher.update(extracted_text.encode("utf-8"))
+        return hasher.hexdigest()
+
+    def _get_path(self, document_type: str, key: str) -> Path:
+        return self.base_path / document_type / f"{key}.json"
+
+    def get[ResultT: BaseModel](
+        self,
+        *,
+        document_type: str,
+        key: str,
+        schema: type[ResultT],
+    ) -> ResultT | None:
+        path = self._get_path(document_type, key)
+        if not path.exists():
+            return None
+
+        try:
+            entry = orjson.loads(path.read_bytes())
+            return schema.model_validate(entry["result"])
+        except (OSError, ValueError, KeyError, ValidationError):
+            logger.warning(
+                "Ignoring unreadable extraction cache entry",
+                extra={"path": str(path)},
+            )
+            return None
+
+    def set(
+        self,
+        *,
+        document_type: str,
+        key: str,
+        result: BaseModel,
+        provider: str,
+        model: str,
+        prompt_version: str,
+    ) -> None:
+        path = self._get_path(document_type, key)
+        entry = {
+            "provider": provider,
+            "model": model,
+            "prompt_version": prompt_version,
+            "timestamp": now().isoformat(),
+            "result": result.model_dump(mode="json"),
+        }
+        # Write to a temporary file first so concurrent readers never see a
+        # partially written entry; writes run in worker threads, so the name
+        # is unique per thread as well as per process
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(orjson.dumps(entry))
+            os.replace(tmp_path, path)
+        except OSError:
+            # The cache is an optimization; a failed write must not fail the
+            # extraction that produced the result
+            tmp_path.unlink(missing_ok=True)
+            logger.warning(
+                "Failed to write extraction cache entry",
+                extra={"path": str(path)},
+            )
+
+
+@functools.lru_cache
+def get_extraction_cache() -> ExtractionCache | None:
+    """Return the extraction cache, or None when EXTRACTION_CACHE_DIR is unset."""
+    cache_dir = get_settings().EXTRACTION_CACHE_DIR
+    if cache_dir is None:
+        return None
+    return ExtractionCache(cache_dir)
@@ -0,0 +1,407 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import typing as tp
+
+import orjson
+from langchain_core.exceptions import OutputParserException
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    HumanMessage,
+    SystemMessage,
+)
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.output_parsers.openai_tools import PydanticToolsParser
+from langchain_core.outputs import ChatGeneration
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain_core.runnables import Runnable, RunnableConfig, RunnableLambda
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from langgraph.graph import END, StateGraph
+from pydantic import BaseModel, ValidationError
+from typing_extensions import TypedDict
+
+from src.agents.extraction_cache import ExtractionCache, get_extraction_cache
+from src.core.base.agents import build_runnable_config, get_llm, truncate_text
+from src.core.settings import StructuredOutputMethod, get_settings
+from src.core.types import DictStrAny
+from src.exceptions import LLMExtractionError, LLMServiceError
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class StructuredExtractorState(TypedDict):
+    extracted_text: str
+    result: BaseModel | None
+
+
+class StructuredExtractor[ResultT: BaseModel]:
+    """Single-node LangGraph agent that extracts `result_schema` from document text.
+
+    The concrete extractors only differ by schema and prompts, so the node,
+    graph and error handling live here and each document module just declares
+    an instance of this class.
+    """
+
+    def __init__(
+        self,
+        *,
+        result_schema: type[ResultT],
+        system_prompt: str,
+        user_prompt_header: str,
+        document_type: str,
+        extractor_name: str,
+        display_name: str,
+        max_validation_retries: int = 2,
+    ) -> None:
+        self.result_schema = result_schema
+        self.system_prompt = system_prompt
+        self.user_prompt_header = user_prompt_header
+        self.document_type = document_type
+        self.extractor_name = extractor_name
+        self.display_name = display_name
+        self.max_validation_retries = max_validation_retries
+        # Built once instead of on every node call. The system prompt is kept
+        # as a message (not a template) so braces in it are never interpreted,
+        # and `feedback` carries validation errors on retries.
+        self.prompt = ChatPromptTemplate.from_messages(
+            [
+                SystemMessage(content=system_prompt),
+                ("user", f"{user_prompt_header}\n{{extracted_text}}\n"),
+                MessagesPlaceholder("feedback", optional=True),
+            ]
+        )
+        # Converting the nested pydantic schema into a tool definition is the
+        # bulk of `with_structured_output`'s cost, so it's done at import time
+        self.tool_schema = convert_to_openai_tool(result_schema)
+        self.structured_output_method = settings.LLM_STRUCTURED_OUTPUT_METHOD
+        if self.structured_output_method == StructuredOutputMethod.JSON_SCHEMA:
+            json_schema = {**self.tool_schema["function"]}
+            json_schema["schema"] = json_schema.pop("parameters")
+            self.response_format = {"type": "json_schema", "json_schema": json_schema}
+            self.output_parser = PydanticOutputParser(pydantic_object=result_schema)
+        else:
+            self.output_parser = PydanticToolsParser(
+                tools=[result_schema],
+                first_tool_only=True,
+            )
+        self._chain: tuple[BaseChatModel, Runnable] | None = None
+        self._graph = None
+
+    @functools.cached_property
+    def prompt_version(self) -> str:
+        """Fingerprint of prompts and schema, used to invalidate cached extractions."""
+        schema = json.dumps(self.tool_schema, sort_keys=True)
+        prompts = f"{self.system_prompt}\0{self.user_prompt_header}\0{schema}"
+        return hashlib.sha256(prompts.encode("utf-8")).hexdigest()[:16]
+
+    def _get_chain(self) -> Runnable:
+        """Return the prompt and model chain; its raw output goes through `output_parser`."""
+        # Rebuilt only when the shared LLM changes (i.e. on a new event loop)
+        llm = get_llm()
+        if self._chain is None or self._chain[0] is not llm:
+            self._chain = (llm, self.prompt | self._bind_structured_output(llm))
+        return self._chain[1]
+
+    def _bind_structured_output(self, llm: BaseChatModel) -> Runnable:
+        # Equivalent to `with_structured_output(method=...)`, but binding the
+        # precomputed schema and leaving parsing to the caller, which needs the
+        # raw message to report invalid outputs
+        ls_structured_output_format = {
+            "kwargs": {"method": self.structured_output_method.value},
+            "schema": self.tool_schema,
+        }
+
+        if self.structured_output_method == StructuredOutputMethod.JSON_SCHEMA:
+            llm = llm.bind(
+                response_format=self.response_format,
+                ls_structured_output_format=ls_structured_output_format,
+            )
+        else:
+            llm = llm.bind_tools(
+                [self.tool_schema],
+                tool_choice=self.tool_schema["function"]["name"],
+                parallel_tool_calls=False,
+                ls_structured_output_format=ls_structured_output_format,
+            )
+        return llm
+
+    def _build_prompt_input(self, extracted_text: str) -> DictStrAny:
+        return {"extracted_text": truncate_text(extracted_text), "feedback": []}
+
+    async def node(
+        self,
+        state: StructuredExtractorState,
+        config: RunnableConfig,
+    ) -> DictStrAny:
+        correlation_id = (config.get("metadata") or {}).get("correlation_id")
+
+        chain = self._get_chain()
+        prompt_input = self._build_prompt_input(state["extracted_text"])
+
+        # Feed schema validation errors back to the model instead of losing
+        # the whole extraction to an occasional malformed output
+        for attempt in range(self.max_validation_retries + 1):
+            message = await chain.ainvoke(prompt_input, config)
+            try:
+                result = await self.output_parser.ainvoke(message, config)
+                break
+            except (ValidationError, OutputParserException) as e:
+                if attempt == self.max_validation_retries:
+                    raise
+                logger.warning(
+                    f"Invalid {self.display_name} extraction output, retrying",
+                    extra={"correlation_id": correlation_id, "attempt": attempt + 1},
+                )
+                # The invalid output is quoted instead of replayed as an AI
+                # message, since a tool call must be followed by its result
+                prompt_input["feedback"].append(
+                    HumanMessage(
+                        content=(
+                            "Sua resposta anterior não passou na validação do "
+                            "formato estruturado.\n"
+                            f"Resposta anterior:\n{self._get_raw_output(message)}\n"
+                            f"Erros:\n{e}\n"
+                            "Corrija os erros e responda novamente com a "
+                            "extração completa."
+                        )
+                    )
+                )
+
+        # LangGraph merges the returned keys into the state
+        return {"result": result}
+
+    def build_graph(self):
+        # Compiled once per extractor; the compiled graph is safe to reuse
+        if self._graph is None:
+            graph = StateGraph(StructuredExtractorState)
+            graph.add_node("extract", self.node)
+            graph.set_entry_point("extract")
+            graph.add_edge("extract", END)
+            self._graph = graph.compile()
+        return self._graph
+
+    def _get_cache_key(self, extracted_text: str) -> str:
+        return ExtractionCache.compute_key(
+            extracted_text=extracted_text,
+            provider=settings.OPENROUTER_API_BASE_URL,
+            model=settings.OPENROUTER_MODEL,
+            prompt_version=self.prompt_version,
+        )
+
+    async def _get_cached(self, extracted_text: str) -> ResultT | None:
+        cache = get_extraction_cache()
+        if cache is None:
+            return None
+        # Disk I/O runs in a worker thread to keep the event loop responsive
+        return await asyncio.to_thread(
+            cache.get,
+            document_type=self.document_type,
+            key=self._get_cache_key(extracted_text),
+            schema=self.result_schema,
+        )
+
+    async def _set_cached(self, extracted_text: str, result: ResultT) -> None:
+        cache = get_extraction_cache()
+        if cache is None:
+            return
+        await asyncio.to_thread(
+            cache.set,
+            document_type=self.document_type,
+            key=self._get_cache_key(extracted_text),
+            result=result,
+            provider=settings.OPENROUTER_API_BASE_URL,
+            model=settings.OPENROUTER_MODEL,
+            prompt_version=self.prompt_version,
+        )
+
+    def _build_empty_result(self) -> ResultT:
+        # Every data schema field is optional, so an empty data model is valid
+        data_schema = self.result_schema.model_fields["data"].annotation
+        return self.result_schema(
+            data=data_schema(),
+            confidence=0.0,
+            notes=["empty input text"],
+        )
+
+    async def _get_precomputed(self, extracted_text: str) -> ResultT | None:
+        """Return a result that doesn't need the LLM: empty input or a cache hit."""
+        if not extracted_text or not extracted_text.strip():
+            return self._build_empty_result()
+        return await self._get_cached(extracted_text)
+
+    def _ensure_result(self, result: ResultT | None) -> ResultT:
+        if result is None:
+            raise LLMExtractionError(
+                f"{self.display_name} extraction did not produce a result",
+                extractor_name=self.extractor_name,
+                document_type=self.document_type,
+            )
+        return result
+
+    async def extract(
+        self,
+        *,
+        extracted_text: str,
+        correlation_id: str | None = None,
+    ) -> ResultT:
+        precomputed = await self._get_precomputed(extracted_text)
+        if precomputed is not None:
+            logger.info(
+                f"Skipping LLM call for {self.display_name} extraction",
+                extra={"correlation_id": correlation_id},
+            )
+            return precomputed
+
+        config = build_runnable_config(correlation_id)
+
+        # A single-node graph only adds state plumbing, so the node is called
+        # directly; `build_graph` remains available for composition
+        try:
+            final_state = await self.node(
+                {
+                    "extracted_text": extracted_text,
+                    "result": None,
+                },
+                config,
+            )
+        except Exception as e:
+            logger.exception(
+                f"LLM service error during {self.display_name} extraction",
+                extra={"correlation_id": correlation_id},
+            )
+            raise LLMServiceError(
+                f"Failed to invoke LLM for {self.display_name} extraction",
+                original_error=e,
+            ) from e
+
+        result = self._ensure_result(final_state.get("result"))
+        await self._set_cached(extracted_text, result)
+        return result
+
+    async def extract_batch(
+        self,
+        *,
+        texts: list[str],
+        correlation_id: str | None = None,
+        max_concurrency: int = 10,
+    ) -> list[ResultT]:
+        """Extract many documents with a bounded-concurrency `abatch` of the node.
+
+        Without `max_concurrency` LangChain schedules every input at once, so
+        always bound it to stay within the provider's rate limits. Empty texts
+        and texts with a cached extraction are answered without the LLM.
+        """
+        results: list[ResultT | None] = list(
+            await asyncio.gather(*(self._get_precomputed(text) for text in texts))
+        )
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+
+        config = build_runnable_config(correlation_id)
+        # A run id can only identify a single run, not every item of the batch
+        config.pop("run_id", None)
+        config["max_concurrency"] = max_concurrency
+
+        try:
+            final_states = await RunnableLambda(self.node).abatch(
+                [{"extracted_text": texts[i], "result": None} for i in pending],
+                config=config,
+            )
+        except Exception as e:
+            logger.exception(
+                f"LLM service error during {self.display_name} batch extraction",
+                extra={"correlation_id": correlation_id},
+            )
+            raise LLMServiceError(
+                f"Failed to invoke LLM for {self.display_name} batch extraction",
+                original_error=e,
+            ) from e
+
+        for i, final_state in zip(pending, final_states, strict=True):
+            results[i] = self._ensure_result(final_state.get("result"))
+            await self._set_cached(texts[i], results[i])
+        return results
+
+    async def stream(
+        self,
+        *,
+        extracted_text: str,
+        correlation_id: str | None = None,
+    ) -> tp.AsyncIterator[ResultT]:
+        """Yield progressively more complete results while the LLM generates them.
+
+        Partial outputs that don't validate against the schema yet are skipped,
+        so every item is a valid result and the last one is the final
+        extraction. It is only cached once the complete output validates.
+        """
+        precomputed = await self._get_precomputed(extracted_text)
+        if precomputed is not None:
+            yield precomputed
+            return
+
+        chain = self._get_chain()
+        config = build_runnable_config(correlation_id)
+
+        # The raw message is accumulated alongside the partial results so the
+        # complete output can be validated strictly once the stream ends
+        message: AIMessageChunk | None = None
+        result = None
+        try:
+            async for chunk in chain.astream(
+                self._build_prompt_input(extracted_text),
+                config=config,
+            ):
+                message = chunk if message is None else message + chunk
+                partial_result = self.output_parser.parse_result(
+                    [ChatGeneration(message=message)],
+                    partial=True,
+                )
+                if partial_result is not None and partial_result != result:
+                    result = partial_result
+                    yield result
+        except Exception as e:
+            logger.exception(
+                f"LLM service error during {self.display_name} streaming extraction",
+                extra={"correlation_id": correlation_id},
+            )
+            raise LLMServiceError(
+                f"Failed to stream LLM output for {self.display_name} extraction",
+                original_error=e,
+            ) from e
+
+        self._ensure_result(result)
+        try:
+            final_result = self.result_schema.model_validate_json(
+                self._get_raw_output(message)
+            )
+        except ValidationError:
+            # Partial parsing tolerates truncated output, so the last partial
+            # result may be incomplete and must not be served from the cache
+            logger.warning(
+                f"Final {self.display_name} streaming output is invalid, not caching",
+                extra={"correlation_id": correlation_id},
+            )
+            return
+        await self._set_cached(extracted_text, final_result)
+
+    def _get_raw_output(self, message: AIMessage) -> str:
+        """Return the JSON the model produced, before any lenient parsing."""
+        if self.structured_output_method == StructuredOutputMethod.JSON_SCHEMA:
+            return message.text
+        # Streamed chunks keep the arguments as sent; complete messages keep
+        # them as sent only when they aren't valid JSON
+        if isinstance(message, AIMessageChunk) and message.tool_call_chunks:
+            return message.tool_call_chunks[0]["args"] or ""
+        if message.invalid_tool_calls:
+            return message.invalid_tool_calls[0]["args"] or ""
+        if message.tool_calls:
+            return orjson.dumps(message.tool_calls[0]["args"]).decode()
+        return message.text
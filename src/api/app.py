@@ -5,10 +5,11 @@ from contextlib import asynccontextmanager
 
 from asgi_correlation_id import CorrelationIdMiddleware
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
 from sqlmodel import SQLModel
 
+from src.api.responses import ORJSONResponse
 from src.api.v1.routes import router as v1_router
+from src.core.base.agents import close_http_async_client, init_langfuse
 from src.core.base.exceptions import (
     ApplicationError,
     ExternalServiceError,
@@ -16,9 +17,10 @@ from src.core.base.exceptions import (
     ResourceNotFoundError,
     ValidationError,
 )
-from src.core.database.core import engine
+from src.core.database.core import engine, warmup_pool
 from src.core.logging.config import LOGGING_CONFIG
 from src.core.settings import get_settings
+from src.core.types import DictStrAny
 
 logging.config.dictConfig(LOGGING_CONFIG)
 
@@ -37,21 +39,25 @@ def include_middleware(app: FastAPI) -> None:
     )
 
 
+def _get_error_log_extra(exc: ApplicationError, request: Request) -> DictStrAny:
+    return {
+        "error_code": exc.code,
+        "error_message": exc.message,
+        "error_details": exc.details,
+        "path": request.url.path,
+    }
+
+
 def include_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(ResourceNotFoundError)
     async def resource_not_found_handler(
         request: Request, exc: ResourceNotFoundError
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         logger.warning(
             "Resource not found",
-            extra={
-                "error_code": exc.code,
-                "error_message": exc.message,
-                "error_details": exc.details,
-                "path": request.url.path,
-            },
+            extra=_get_error_log_extra(exc, request),
         )
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=404,
             content=exc.to_dict(),
         )
@@ -59,17 +65,12 @@ def include_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(ValidationError)
     async def validation_error_handler(
         request: Request, exc: ValidationError
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         logger.warning(
             "Validation error",
-            extra={
-                "error_code": exc.code,
-                "error_message": exc.message,
-                "error_details": exc.details,
-                "path": request.url.path,
-            },
+            extra=_get_error_log_extra(exc, request),
         )
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=422,
             content=exc.to_dict(),
         )
@@ -77,17 +78,12 @@ def include_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(ExternalServiceError)
     async def external_service_error_handler(
         request: Request, exc: ExternalServiceError
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         logger.error(
             "External service error",
-            extra={
-                "error_code": exc.code,
-                "error_message": exc.message,
-                "error_details": exc.details,
-                "path": request.url.path,
-            },
+            extra=_get_error_log_extra(exc, request),
         )
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=502,
             content=exc.to_dict(),
         )
@@ -95,17 +91,12 @@ def include_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(ProcessingError)
     async def processing_error_handler(
         request: Request, exc: ProcessingError
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         logger.error(
             "Processing error",
-            extra={
-                "error_code": exc.code,
-                "error_message": exc.message,
-                "error_details": exc.details,
-                "path": request.url.path,
-            },
+            extra=_get_error_log_extra(exc, request),
         )
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content=exc.to_dict(),
         )
@@ -113,17 +104,12 @@ def include_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(ApplicationError)
     async def application_error_handler(
         request: Request, exc: ApplicationError
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         logger.error(
             "Application error",
-            extra={
-                "error_code": exc.code,
-                "error_message": exc.message,
-                "error_details": exc.details,
-                "path": request.url.path,
-            },
+            extra=_get_error_log_extra(exc, request),
         )
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content=exc.to_dict(),
         )
@@ -131,9 +117,16 @@ def include_exception_handlers(app: FastAPI) -> None:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> tp.AsyncGenerator[None, None]:
-    async with engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.create_all)
+    if settings.AUTO_CREATE_SCHEMA:
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+    await warmup_pool()
+    if settings.LANGFUSE_ENABLED:
+        init_langfuse()
     yield
+    # The streaming endpoint keeps an HTTP client on the server's event loop
+    await close_http_async_client()
+    await engine.dispose()
 
 
 app = FastAPI(
@@ -0,0 +1,18 @@
+import typing as tp
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson.
+
+    Defined here because FastAPI's own `ORJSONResponse` is deprecated in newer
+    releases in favour of pydantic serialization of response models, which
+    doesn't apply to the plain dicts built by the exception handlers.
+    """
+
+    def render(self, content: tp.Any) -> bytes:
+        # Error details may carry values orjson can't encode (e.g. Decimal or
+        # exceptions), which are rendered as strings like `to_json_bytes` does
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
@@ -1,11 +1,15 @@
 import typing as tp
 import uuid
 
+import orjson
 from asgi_correlation_id import correlation_id
 from fastapi import APIRouter, Form
+from fastapi.responses import StreamingResponse
 
 from src import schemas, usecases
 from src.api.dependencies import SessionDep
+from src.core.base.exceptions import ApplicationError
+from src.core.types import DictStrAny
 
 router = APIRouter(
     prefix="/v1",
@@ -50,3 +54,36 @@ async def get_document_analysis_job(
         job_id=job_id,
         correlation_id=correlation_id.get(),
     ).handle()
+
+
+async def _to_server_sent_events(
+    events: tp.AsyncIterator[DictStrAny],
+) -> tp.AsyncIterator[bytes]:
+    # Events are written as UTF-8 bytes straight from orjson, so they're never
+    # decoded to str just to be encoded again by the response
+    try:
+        async for event in events:
+            yield b"data: " + orjson.dumps(event) + b"\n\n"
+    except ApplicationError as exc:
+        # Headers are already sent, so errors are reported as an SSE event
+        yield b"event: error\ndata: " + exc.to_json_bytes() + b"\n\n"
+        return
+    yield b"event: done\ndata: {}\n\n"
+
+
+@router.get("/analyses/{job_id}/documents/{document_id}/extraction/stream")
+async def stream_document_extraction(
+    session: SessionDep,
+    job_id: uuid.UUID,
+    document_id: uuid.UUID,
+):
+    events = await usecases.StreamDocumentExtraction(
+        session=session,
+        job_id=job_id,
+        document_id=document_id,
+        correlation_id=correlation_id.get(),
+    ).handle()
+    return StreamingResponse(
+        _to_server_sent_events(events),
+        media_type="text/event-stream",
+    )
@@ -1,25 +1,43 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import itertools
+import weakref
+
+import httpx
+from langchain_core.caches import InMemoryCache
 from langchain_core.runnables import RunnableConfig
 from langchain_openai import ChatOpenAI
 from langfuse import Langfuse
-from langfuse import get_client as get_langfuse_client
 from langfuse.langchain import CallbackHandler as LangfuseCallbackHandler
 
 from src.core.settings import get_settings
 
 settings = get_settings()
 
-if settings.LANGFUSE_ENABLED:
-    Langfuse(
+
+@functools.lru_cache(maxsize=1)
+def init_langfuse() -> Langfuse:
+    """Create the Langfuse client on first use rather than at import time.
+
+    The client starts background export threads, which don't survive a fork,
+    so it must be created in each API/Celery worker process, not in the parent.
+    """
+    return Langfuse(
         public_key=settings.LANGFUSE_PUBLIC_KEY,
         secret_key=settings.LANGFUSE_SECRET_KEY,
         host=settings.LANGFUSE_BASE_URL,
     )
-    langfuse = get_langfuse_client()
 
 
+# The handler keeps its per-run state (spans, context tokens) keyed by run id,
+# so a single instance can trace concurrent invocations; only `last_trace_id`
+# is shared and nothing reads it. The correlation id travels in the metadata
+@functools.lru_cache(maxsize=1)
 def build_langfuse_callback() -> LangfuseCallbackHandler:
+    # The handler looks up the client registered for its public key
+    init_langfuse()
     return LangfuseCallbackHandler(
         public_key=settings.LANGFUSE_PUBLIC_KEY,
         update_trace=True,
@@ -45,11 +63,48 @@ def build_runnable_config(correlation_id: str | None = None) -> RunnableConfig:
     )
 
 
-def build_llm(correlation_id: str | None = None) -> ChatOpenAI:
-    callbacks = None
-    if settings.LANGFUSE_ENABLED:
-        callbacks = [build_langfuse_callback()]
+# httpx connections are bound to the event loop that opened them, so each loop
+# (e.g. each Celery task running under asyncio.run) gets its own pool
+_http_async_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, httpx.AsyncClient
+] = weakref.WeakKeyDictionary()
+
+
+def get_http_async_client() -> httpx.AsyncClient | None:
+    """Keep-alive HTTP client shared by every LLM call on the running loop."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+    client = _http_async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+            timeout=settings.LLM_HTTP_TIMEOUT,
+        )
+        _http_async_clients[loop] = client
+    return client
+
+
+async def close_http_async_client() -> None:
+    client = _http_async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+@functools.lru_cache(maxsize=1)
+def get_llm_cache() -> InMemoryCache | None:
+    """Process-wide LLM response cache shared by every model built here."""
+    if not settings.LLM_CACHE_ENABLED:
+        return None
+    return InMemoryCache(maxsize=settings.LLM_CACHE_MAX_SIZE)
 
+
+def _build_chat_model(callbacks: list | None = None) -> ChatOpenAI:
     return ChatOpenAI(
         api_key=settings.OPENROUTER_API_KEY,
         base_url=settings.OPENROUTER_API_BASE_URL,
@@ -57,17 +112,57 @@ def build_llm(correlation_id: str | None = None) -> ChatOpenAI:
         temperature=settings.OPENROUTER_TEMPERATURE,
         reasoning_effort="low",
         callbacks=callbacks,
+        cache=get_llm_cache(),
+        http_async_client=get_http_async_client(),
     )
 
 
+def build_llm(correlation_id: str | None = None) -> ChatOpenAI:
+    callbacks = None
+    if settings.LANGFUSE_ENABLED:
+        callbacks = [build_langfuse_callback()]
+
+    return _build_chat_model(callbacks)
+
+
+_shared_llms: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ChatOpenAI] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_llm() -> ChatOpenAI:
+    """LLM shared by every call on the running loop.
+
+    It carries no per-call callbacks: tracing handlers and the correlation id
+    must be passed through the RunnableConfig of each invocation (see
+    `build_runnable_config`). Like the HTTP client, it's kept per event loop.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return _build_chat_model()
+
+    llm = _shared_llms.get(loop)
+    if llm is None or llm.http_async_client is not get_http_async_client():
+        llm = _build_chat_model()
+        _shared_llms[loop] = llm
+    return llm
+
+
 def truncate_text(text: str, *, max_chars: int = 6000) -> str:
-    text = (text or "").strip()
-    if len(text) <= max_chars:
-        return text
-    return text[:max_chars]
+    if not text:
+        return ""
+    # Same as `text.strip()[:max_chars]`, but only the kept window is copied
+    # instead of the whole (possibly multi-MB) extracted text
+    start, end = 0, len(text)
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return text[start : min(end, start + max_chars)]
 
 
 def limit_list(items: list[str], *, max_items: int = 3) -> list[str]:
     if max_items <= 0:
         return []
-    return list(items[:max_items])
+    return list(itertools.islice(items, max_items))
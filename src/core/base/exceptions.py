@@ -7,6 +7,8 @@ the application. All custom exceptions should inherit from these base classes.
 
 from typing import Any
 
+import orjson
+
 
 class ApplicationError(Exception):
     default_message: str = "An unexpected error occurred"
@@ -33,6 +35,14 @@ class ApplicationError(Exception):
             }
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize `to_dict()` straight to JSON bytes for writing to the wire."""
+        return orjson.dumps(
+            self.to_dict(),
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
+
 
 class ResourceNotFoundError(ApplicationError):
     default_message = "Resource not found"
@@ -3,17 +3,23 @@ import typing as tp
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime
+from sqlalchemy import DateTime, Index, bindparam, text
+from sqlalchemy.orm import declared_attr
+from sqlalchemy.sql.base import ExecutableOption
 from sqlalchemy.sql.elements import BinaryExpression
 from sqlmodel import Field, SQLModel, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.core.utils.datetime import now
+from src.core.utils.uuid import uuid7
+
+# `get_by_id` statements per model, built once and executed with a bound id
+_get_by_id_statements: dict[type[SQLModel], tp.Any] = {}
 
 
 class DBModel(SQLModel):
     id: uuid.UUID = Field(
-        default_factory=uuid.uuid4,
+        default_factory=uuid7,
         primary_key=True,
     )
     created_at: datetime = Field(
@@ -24,7 +30,6 @@ class DBModel(SQLModel):
     deleted_at: datetime | None = Field(
         default=None,
         nullable=True,
-        index=True,
         sa_type=DateTime(timezone=True),
     )
     updated_at: datetime = Field(
@@ -33,6 +38,18 @@ class DBModel(SQLModel):
         sa_type=DateTime(timezone=True),
     )
 
+    @declared_attr
+    def __table_args__(cls) -> tuple[Index, ...]:
+        # Almost every query only wants live rows, so a partial index over
+        # them stays small instead of indexing every soft-deleted row too
+        return (
+            Index(
+                f"ix_{cls.__tablename__}_deleted_at_null",
+                "deleted_at",
+                postgresql_where=text("deleted_at IS NULL"),
+            ),
+        )
+
     @classmethod
     async def filter(
         cls,
@@ -41,8 +58,14 @@ class DBModel(SQLModel):
         filters: list[BinaryExpression] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        include_deleted: bool = False,
+        options: list[ExecutableOption] | None = None,
     ) -> list[tp.Self]:
         stmt = select(cls)
+        if options:
+            stmt = stmt.options(*options)
+        if not include_deleted:
+            stmt = stmt.where(cls.deleted_at.is_(None))
         if filters:
             stmt = stmt.where(*filters)
 
@@ -53,7 +76,8 @@ class DBModel(SQLModel):
             stmt = stmt.offset(offset)
 
         result = await session.exec(stmt)
-        return result.all()  # type: ignore
+        # `unique` is required when collections are eagerly joined
+        return result.unique().all()  # type: ignore
 
     @classmethod
     async def get_by_id(
@@ -61,7 +85,15 @@ class DBModel(SQLModel):
         session: AsyncSession,
         *,
         id: uuid.UUID,
+        options: list[ExecutableOption] | None = None,
     ) -> tp.Self | None:
-        stmt = select(cls).where(cls.id == id)
-        result = await session.exec(stmt)
-        return result.one_or_none()
+        stmt = _get_by_id_statements.get(cls)
+        if stmt is None:
+            stmt = select(cls).where(cls.id == bindparam("id"))
+            _get_by_id_statements[cls] = stmt
+        if options:
+            # e.g. `selectinload` relationships that will be serialized, so
+            # they're fetched in one query each instead of lazily per row
+            stmt = stmt.options(*options)
+        result = await session.exec(stmt, params={"id": id})
+        return result.unique().one_or_none()
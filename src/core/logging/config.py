@@ -15,13 +15,8 @@ LOGGING_CONFIG = {
             "format": "%(levelname)s [%(correlation_id)s] %(name)s %(message)s",
         },
         "json": {
-            "()": "pythonjsonlogger.jsonlogger.JsonFormatter",
-            "fmt": "%(asctime)s %(levelname)s %(correlation_id)s %(message)s",
+            "()": "src.core.logging.formatters.JSONFormatter",
             "datefmt": "%Y-%m-%dT%H:%M:%S%z",
-            "rename_fields": {
-                "asctime": "timestamp",
-                "levelname": "level",
-            },
         },
     },
     "handlers": {
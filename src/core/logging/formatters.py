@@ -0,0 +1,40 @@
+import logging
+import typing as tp
+
+import orjson
+
+# Attributes every LogRecord has; anything else on a record came from `extra`
+_RECORD_ATTRS = frozenset(
+    logging.LogRecord("", logging.NOTSET, "", 0, "", (), None).__dict__
+) | {"message", "asctime", "correlation_id"}
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per record, serialized with orjson.
+
+    Emits the same keys as the previous python-json-logger setup (`timestamp`,
+    `level`, `correlation_id`, `message` plus any `extra` fields), but builds
+    the payload directly instead of parsing a format string for every record.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: dict[str, tp.Any] = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "correlation_id": getattr(record, "correlation_id", None),
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                payload[key] = value
+
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            payload["stack_info"] = self.formatStack(record.stack_info)
+
+        return orjson.dumps(
+            payload,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS,
+        ).decode()
@@ -1,4 +1,5 @@
 import enum
+import functools
 from pathlib import Path
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -13,6 +14,11 @@ class StorageBackend(enum.StrEnum):
     LOCAL = "local"
 
 
+class StructuredOutputMethod(enum.StrEnum):
+    FUNCTION_CALLING = "function_calling"
+    JSON_SCHEMA = "json_schema"
+
+
 class Settings(BaseSettings):
     DEBUG: bool = True
 
@@ -22,6 +28,17 @@ class Settings(BaseSettings):
     POSTGRES_PORT: str
     POSTGRES_DB: str
     POSTGRES_DRIVER: str = "postgresql+asyncpg"
+    # Per process: every API worker and Celery worker process has its own pool
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800
+    # Log every SQL statement (only honoured when DEBUG is on)
+    SQL_ECHO: bool = False
+    # Log statements slower than this many milliseconds (None disables it)
+    SQL_SLOW_QUERY_THRESHOLD_MS: float | None = 100.0
+    # Create missing tables on API startup; disable once the schema exists to
+    # spare every worker of a multi-worker deploy the startup DDL round trips
+    AUTO_CREATE_SCHEMA: bool = True
 
     REDIS_HOST: str
     REDIS_PORT: int
@@ -31,15 +48,36 @@ class Settings(BaseSettings):
     OPENROUTER_API_BASE_URL: str
     OPENROUTER_MODEL: str 
     OPENROUTER_TEMPERATURE: float = 0.0
+    # Use JSON_SCHEMA only with models that support native structured outputs
+    LLM_STRUCTURED_OUTPUT_METHOD: StructuredOutputMethod = (
+        StructuredOutputMethod.FUNCTION_CALLING
+    )
+
+    # Connection pool for LLM provider requests
+    LLM_HTTP_MAX_CONNECTIONS: int = 100
+    LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    LLM_HTTP_TIMEOUT: float = 60.0
+
+    # In-process cache of LLM responses keyed by prompt and model parameters.
+    # Off by default: responses are cached before they are validated, so an
+    # invalid output would be served again to every later extraction of the
+    # same text. The extraction cache stores validated results instead.
+    LLM_CACHE_ENABLED: bool = False
+    LLM_CACHE_MAX_SIZE: int = 1024
 
     UVICORN_HOST: str = "0.0.0.0"
     UVICORN_PORT: int = 8000
     UVICORN_RELOAD: bool = False
+    # Each worker opens its own database pool (see DB_POOL_SIZE)
+    UVICORN_WORKERS: int = 1
 
     # Storage settings
     STORAGE_BACKEND: StorageBackend = StorageBackend.LOCAL
     STORAGE_LOCAL_PATH: Path = BASE_DIR / "static"
 
+    # Extraction cache settings (disabled when unset)
+    EXTRACTION_CACHE_DIR: Path | None = None
+
     # Langfuse settings
     LANGFUSE_PUBLIC_KEY: str | None = None
     LANGFUSE_SECRET_KEY: str | None = None
@@ -50,15 +88,16 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
     )
 
-    @property
+    # Derived values are computed once: settings are not mutated at runtime
+    @functools.cached_property
     def POSTGRES_URL(self) -> str:
         return f"{self.POSTGRES_DRIVER}://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
 
-    @property
+    @functools.cached_property
     def REDIS_URL(self) -> str:
         return f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_DB}"
 
-    @property
+    @functools.cached_property
     def LANGFUSE_ENABLED(self) -> bool:
         return (
             self.LANGFUSE_PUBLIC_KEY is not None
@@ -2,7 +2,9 @@
 Dependency injection for services.
 """
 
+import typing as tp
 from functools import lru_cache
+from types import MappingProxyType
 
 from src.core.settings import StorageBackend, get_settings
 from src.core.storage.backends import FileStorage, LocalFileStorage
@@ -10,14 +12,25 @@ from src.core.storage.backends import FileStorage, LocalFileStorage
 settings = get_settings()
 
 
+# Factories read the settings when called, so `get_storage.cache_clear()` picks
+# up settings changed at runtime
+_BACKENDS: MappingProxyType[StorageBackend, tp.Callable[[], FileStorage]] = (
+    MappingProxyType(
+        {
+            StorageBackend.LOCAL: lambda: LocalFileStorage(
+                base_path=settings.STORAGE_LOCAL_PATH
+            ),
+        }
+    )
+)
+
+
 @lru_cache
 def get_storage() -> FileStorage:
-    match settings.STORAGE_BACKEND:
-        case StorageBackend.LOCAL:
-            return LocalFileStorage(base_path=settings.STORAGE_LOCAL_PATH)
-
-        case _:
-            raise ValueError(f"Unsupported storage backend: {settings.STORAGE_BACKEND}")
+    factory = _BACKENDS.get(settings.STORAGE_BACKEND)
+    if factory is None:
+        raise ValueError(f"Unsupported storage backend: {settings.STORAGE_BACKEND}")
+    return factory()
 
 
 __all__ = [
@@ -1,9 +1,17 @@
 import abc
+import asyncio
 import hashlib
+import os
+import typing as tp
 from pathlib import Path
 
 from pydantic import BaseModel
 
+# Chunks stay cache-resident between hashing and writing them
+WRITE_CHUNK_SIZE = 64 * 1024
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC
+
 
 class StoredFileInfo(BaseModel):
     object_key: str
@@ -15,7 +23,7 @@ class FileStorage(abc.ABC):
     @abc.abstractmethod
     async def save(
         self,
-        content: bytes,
+        content: bytes | tp.AsyncIterator[bytes],
         object_key: str,
     ) -> StoredFileInfo: ...
 
@@ -41,34 +49,99 @@ class LocalFileStorage(FileStorage):
     def _get_full_path(self, object_key: str) -> Path:
         return self.base_path / object_key
 
-    async def save(self, content: bytes, object_key: str) -> StoredFileInfo:
+    async def save(
+        self,
+        content: bytes | tp.AsyncIterator[bytes],
+        object_key: str,
+    ) -> StoredFileInfo:
         full_path = self._get_full_path(object_key)
 
-        full_path.parent.mkdir(parents=True, exist_ok=True)
+        if not isinstance(content, bytes):
+            return await self._save_stream(content, full_path, object_key)
 
-        full_path.write_bytes(content)
+        # Off the event loop: hashlib (OpenSSL, SHA-NI when available) and file
+        # writes both release the GIL for large buffers
+        checksum = await asyncio.to_thread(
+            self._write_with_checksum, full_path, content
+        )
 
         return StoredFileInfo(
             object_key=object_key,
             size_bytes=len(content),
-            checksum_sha256=self.compute_checksum(content),
+            checksum_sha256=checksum,
         )
 
+    async def _save_stream(
+        self,
+        chunks: tp.AsyncIterator[bytes],
+        full_path: Path,
+        object_key: str,
+    ) -> StoredFileInfo:
+        """Write and hash chunks as they arrive, never holding the whole file."""
+        hasher = hashlib.sha256()
+        size_bytes = 0
+        fd = await asyncio.to_thread(self._open_for_write, full_path)
+        try:
+            async for chunk in chunks:
+                hasher.update(chunk)
+                await asyncio.to_thread(self._write_all, fd, chunk)
+                size_bytes += len(chunk)
+        except BaseException:
+            os.close(fd)
+            full_path.unlink(missing_ok=True)
+            raise
+        os.close(fd)
+
+        return StoredFileInfo(
+            object_key=object_key,
+            size_bytes=size_bytes,
+            checksum_sha256=hasher.hexdigest(),
+        )
+
+    @staticmethod
+    def _write_with_checksum(full_path: Path, content: bytes) -> str:
+        """Write `content` and hash it in the same pass over the buffer."""
+        hasher = hashlib.sha256()
+        view = memoryview(content)
+        fd = LocalFileStorage._open_for_write(full_path)
+        try:
+            for start in range(0, len(view), WRITE_CHUNK_SIZE):
+                chunk = view[start : start + WRITE_CHUNK_SIZE]
+                hasher.update(chunk)
+                LocalFileStorage._write_all(fd, chunk)
+        finally:
+            os.close(fd)
+        return hasher.hexdigest()
+
+    @staticmethod
+    def _open_for_write(full_path: Path) -> int:
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        return os.open(full_path, _WRITE_FLAGS, 0o666)
+
+    @staticmethod
+    def _write_all(fd: int, data: bytes | memoryview) -> None:
+        """Write straight to the file descriptor, skipping Python's buffering."""
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+
     async def load(self, object_key: str) -> bytes:
         full_path = self._get_full_path(object_key)
 
-        if not full_path.exists():
-            raise FileNotFoundError(f"File not found: {object_key}")
-
-        return full_path.read_bytes()
+        # Reading directly avoids a separate stat and the race between the two
+        try:
+            return await asyncio.to_thread(full_path.read_bytes)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {object_key}") from None
 
     async def delete(self, object_key: str) -> bool:
         full_path = self._get_full_path(object_key)
 
-        if not full_path.exists():
+        try:
+            await asyncio.to_thread(full_path.unlink)
+        except FileNotFoundError:
             return False
-
-        full_path.unlink()
         return True
 
     async def exists(self, object_key: str) -> bool:
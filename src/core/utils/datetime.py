@@ -1,5 +1,18 @@
-from datetime import datetime, timezone
+import calendar
+from datetime import date, datetime, timezone
 
 
 def now() -> datetime:
     return datetime.now(timezone.utc)
+
+
+def subtract_months(value: date, months: int) -> date:
+    """Subtract calendar months, clamping the day to the target month's length.
+
+    Matches `value - relativedelta(months=months)` (e.g. Aug 31 - 6 months is
+    Feb 28/29) without the generic relativedelta machinery.
+    """
+    year, month_index = divmod(value.year * 12 + value.month - 1 - months, 12)
+    month = month_index + 1
+    day = min(value.day, calendar.monthrange(year, month)[1])
+    return value.replace(year=year, month=month, day=day)
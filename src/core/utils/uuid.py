@@ -0,0 +1,33 @@
+import os
+import threading
+import time
+import uuid
+
+_lock = threading.Lock()
+_last_value = 0
+
+
+def uuid7() -> uuid.UUID:
+    """Return a time-ordered UUIDv7 (RFC 9562).
+
+    The 48 most significant bits hold the Unix timestamp in milliseconds and the
+    rest is random, so ids generated later sort after earlier ones and btree
+    indexes on them are filled sequentially instead of at random pages. Ids from
+    the same millisecond are kept monotonic within the process by incrementing
+    the previous one.
+    """
+    global _last_value
+
+    timestamp_ms = time.time_ns() // 1_000_000
+    random_bits = int.from_bytes(os.urandom(10))
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | random_bits
+    # Set the version (0b0111) and variant (0b10) bits
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    with _lock:
+        # Same millisecond (or the clock moved back): the random part is bumped
+        # instead, as allowed by RFC 9562 section 6.2
+        if value <= _last_value:
+            value = _last_value + 1
+        _last_value = value
+    return uuid.UUID(int=value)
@@ -11,4 +11,9 @@ if __name__ == "__main__":
         host=settings.UVICORN_HOST,
         port=settings.UVICORN_PORT,
         reload=settings.UVICORN_RELOAD,
+        workers=settings.UVICORN_WORKERS,
+        # Both come with uvicorn[standard]; fail loudly instead of silently
+        # falling back to the pure-Python loop and parser
+        loop="uvloop",
+        http="httptools",
     )
@@ -1,5 +1,10 @@
-import io
+import atexit
 import logging
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
 
 import pymupdf
 
@@ -11,8 +16,96 @@ logger = logging.getLogger(__name__)
 # Below this, we assume the PDF might be scanned/image-based.
 MIN_TEXT_LENGTH_THRESHOLD = 50
 
+# Each pool worker reopens the PDF and results cross a process boundary, so
+# shorter documents are faster to extract serially
+MIN_PAGES_FOR_PARALLEL_EXTRACTION = 16
+DEFAULT_EXTRACTION_WORKERS = min(os.cpu_count() or 1, 4)
 
-def _extract_text_with_ocr_fallback(pdf_path: str) -> str:
+
+def _get_pages_text(doc: pymupdf.Document, start: int, end: int) -> str:
+    # `join` sizes the result once instead of growing a StringIO buffer and
+    # copying it again on `getvalue()`
+    return "".join([doc[page_number].get_text() for page_number in range(start, end)])
+
+
+def _extract_page_range(pdf_path: str, start: int, end: int) -> str:
+    # Runs in a pool worker; PyMuPDF documents can't be pickled, so each
+    # worker opens its own
+    with pymupdf.open(pdf_path) as doc:
+        return _get_pages_text(doc, start, end)
+
+
+_extraction_pool: ProcessPoolExecutor | None = None
+_extraction_pool_lock = threading.Lock()
+
+
+def _get_extraction_pool() -> ProcessPoolExecutor:
+    # Created once and kept for the life of the process so workers are only
+    # spawned once; `num_workers` only sets how many page ranges are submitted.
+    # `spawn` because extraction is usually called from a thread, where
+    # forking is unsafe
+    global _extraction_pool
+    with _extraction_pool_lock:
+        if _extraction_pool is None:
+            _extraction_pool = ProcessPoolExecutor(
+                max_workers=DEFAULT_EXTRACTION_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _extraction_pool
+
+
+def shutdown_extraction_pool() -> None:
+    """Stop the extraction worker processes, if they were started."""
+    global _extraction_pool
+    with _extraction_pool_lock:
+        pool, _extraction_pool = _extraction_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+atexit.register(shutdown_extraction_pool)
+
+
+def _extract_native_text(
+    doc: pymupdf.Document,
+    pdf_path: str,
+    num_workers: int,
+) -> str:
+    page_count = doc.page_count
+    # Daemonic processes (e.g. Celery prefork workers) can't have children
+    if (
+        num_workers <= 1
+        or page_count < MIN_PAGES_FOR_PARALLEL_EXTRACTION
+        or multiprocessing.current_process().daemon
+    ):
+        return _get_pages_text(doc, 0, page_count)
+
+    pool = _get_extraction_pool()
+    pages_per_worker = math.ceil(page_count / num_workers)
+    futures = [
+        pool.submit(
+            _extract_page_range,
+            pdf_path,
+            start,
+            min(start + pages_per_worker, page_count),
+        )
+        for start in range(0, page_count, pages_per_worker)
+    ]
+    # Joined in submission order to keep the pages in order
+    return "".join(future.result() for future in futures)
+
+
+def _get_stripped_length(text: str) -> int:
+    """Return `len(text.strip())` without copying the (possibly huge) text."""
+    start, end = 0, len(text)
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return end - start
+
+
+def _extract_text_with_ocr_fallback(doc: pymupdf.Document, pdf_path: str) -> str:
     """
     Fallback OCR extraction for scanned/image-based PDFs.
 
@@ -36,16 +129,18 @@ def _extract_text_with_ocr_fallback(pdf_path: str) -> str:
     Google Cloud Vision would be recommended due to their specialized
     document parsing capabilities and high accuracy with Brazilian documents.
 
-    Implementation with Tesseract would look like:
+    Implementation with Tesseract would look like (rendering the pages of
+    the already open document instead of parsing the file again):
     ```python
     import pytesseract
     from PIL import Image
 
-    images = convert_from_path(pdf_path)
-    text = ""
-    for image in images:
-        text += pytesseract.image_to_string(image, lang="por")
-    return text
+    texts = []
+    for page in doc:
+        pixmap = page.get_pixmap(dpi=300)
+        image = Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples)
+        texts.append(pytesseract.image_to_string(image, lang="por"))
+    return "".join(texts)
     ```
 
     For now, we return an empty string and let the system handle it gracefully
@@ -59,11 +154,17 @@ def _extract_text_with_ocr_fallback(pdf_path: str) -> str:
     return ""
 
 
-def extract_text_from_pdf(pdf_path: str, *, use_ocr_fallback: bool = True) -> str:
+def extract_text_from_pdf(
+    pdf_path: str,
+    *,
+    use_ocr_fallback: bool = True,
+    num_workers: int = DEFAULT_EXTRACTION_WORKERS,
+) -> str:
     """
     Extract text content from a PDF file.
 
-    Uses PyMuPDF for native text extraction. If the extracted text is below
+    Uses PyMuPDF for native text extraction, splitting long documents into
+    page ranges extracted in parallel processes. If the extracted text is below
     a minimum threshold (indicating a scanned/image-based PDF), optionally
     falls back to OCR extraction.
 
@@ -71,6 +172,9 @@ def extract_text_from_pdf(pdf_path: str, *, use_ocr_fallback: bool = True) -> st
         pdf_path: Path to the PDF file.
         use_ocr_fallback: Whether to attempt OCR if native extraction yields
                           insufficient text. Defaults to True.
+        num_workers: Number of page ranges extracted in parallel for documents
+                     with at least MIN_PAGES_FOR_PARALLEL_EXTRACTION pages. The
+                     shared pool runs at most DEFAULT_EXTRACTION_WORKERS at once.
 
     Returns:
         Extracted text content from the PDF.
@@ -79,30 +183,28 @@ def extract_text_from_pdf(pdf_path: str, *, use_ocr_fallback: bool = True) -> st
         PDFExtractionError: If the PDF cannot be read or processed.
     """
     try:
-        string_buffer = io.StringIO()
+        # Opened once and shared by the native extraction and the OCR fallback
         with pymupdf.open(pdf_path) as doc:
-            for page in doc:
-                string_buffer.write(page.get_text())
-
-        extracted_text = string_buffer.getvalue()
-
-        # Check if we got meaningful text
-        if len(extracted_text.strip()) < MIN_TEXT_LENGTH_THRESHOLD:
-            logger.info(
-                "PDF text extraction yielded minimal content, may be scanned PDF",
-                extra={
-                    "pdf_path": pdf_path,
-                    "extracted_length": len(extracted_text.strip()),
-                    "threshold": MIN_TEXT_LENGTH_THRESHOLD,
-                },
-            )
-
-            if use_ocr_fallback:
-                ocr_text = _extract_text_with_ocr_fallback(pdf_path)
-                if ocr_text.strip():
-                    return ocr_text
-
-        return extracted_text
+            extracted_text = _extract_native_text(doc, pdf_path, num_workers)
+
+            # Check if we got meaningful text
+            stripped_length = _get_stripped_length(extracted_text)
+            if stripped_length < MIN_TEXT_LENGTH_THRESHOLD:
+                logger.info(
+                    "PDF text extraction yielded minimal content, may be scanned PDF",
+                    extra={
+                        "pdf_path": pdf_path,
+                        "extracted_length": stripped_length,
+                        "threshold": MIN_TEXT_LENGTH_THRESHOLD,
+                    },
+                )
+
+                if use_ocr_fallback:
+                    ocr_text = _extract_text_with_ocr_fallback(doc, pdf_path)
+                    if ocr_text.strip():
+                        return ocr_text
+
+            return extracted_text
 
     except FileNotFoundError as e:
         raise PDFExtractionError(
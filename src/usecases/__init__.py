@@ -2,10 +2,12 @@ from src.usecases.analysis import (
     AnalyzeDocuments,
     CreateDocumentAnalysisJob,
     GetDocumentAnalysisJob,
+    StreamDocumentExtraction,
 )
 
 __all__ = [
     "AnalyzeDocuments",
     "CreateDocumentAnalysisJob",
     "GetDocumentAnalysisJob",
+    "StreamDocumentExtraction",
 ]
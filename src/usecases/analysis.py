@@ -1,24 +1,83 @@
+import asyncio
+import functools
 import logging
+import typing as tp
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 
 from fastapi import UploadFile
-from sqlalchemy.orm import selectinload
+from sqlalchemy import insert
+from sqlalchemy.orm import joinedload, selectinload
 from sqlmodel import select
 
 from src import agents, enums, models
 from src.core.base.exceptions import ApplicationError
 from src.core.base.usecases import UseCase
 from src.core.storage import get_storage
-from src.core.storage.backends import LocalFileStorage
+from src.core.storage.backends import FileStorage, LocalFileStorage
 from src.core.types import DictStrAny
 from src.core.utils.datetime import now
-from src.exceptions import AnalysisJobNotFoundError
+from src.exceptions import (
+    AnalysisJobNotFoundError,
+    DocumentNotFoundError,
+    InvalidDocumentTypeError,
+)
 from src.schemas import AnalysisCreateInput
 from src.services.pdf import extract_text_from_pdf
 from src.worker.celery import celery_app
 
 logger = logging.getLogger(__name__)
 
+# PyMuPDF holds the GIL while parsing, so more threads wouldn't extract any
+# faster; a dedicated pool also keeps parsing from starving the default
+# executor used by storage and broker I/O
+_pdf_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pdf-extract")
+
+# Extractors and streams are resolved on `agents` when called, so they can
+# still be patched
+_EXTRACTOR_NAMES: MappingProxyType[enums.DocumentType, str] = MappingProxyType(
+    {
+        enums.DocumentType.CONTRATO_SOCIAL: "extract_contrato_social",
+        enums.DocumentType.CARTAO_CNPJ: "extract_cartao_cnpj",
+        enums.DocumentType.CERTIDAO_NEGATIVA: "extract_certidao_negativa_federal",
+    }
+)
+_STREAM_NAMES: MappingProxyType[enums.DocumentType, str] = MappingProxyType(
+    {
+        enums.DocumentType.CONTRATO_SOCIAL: "stream_contrato_social",
+        enums.DocumentType.CARTAO_CNPJ: "stream_cartao_cnpj",
+        enums.DocumentType.CERTIDAO_NEGATIVA: "stream_certidao_negativa_federal",
+    }
+)
+
+
+async def read_upload_file_chunks(
+    upload_file: UploadFile,
+    chunk_size: int = 1024 * 1024,
+) -> tp.AsyncIterator[bytes]:
+    """Yield an upload in chunks so storage never buffers the whole file."""
+    while chunk := await upload_file.read(chunk_size):
+        yield chunk
+
+
+async def extract_document_text(file_path: str) -> str:
+    """Run the blocking PDF extraction off the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_pdf_executor, extract_text_from_pdf, file_path)
+
+
+def get_document_file_path(
+    document: models.Document,
+    storage: FileStorage | None = None,
+) -> str:
+    storage = storage or get_storage()
+
+    if isinstance(storage, LocalFileStorage):
+        return str(storage.get_absolute_path(document.object_key))
+
+    raise NotImplementedError("Non-local storage not yet supported for PDF extraction")
+
 
 class CreateDocumentAnalysisJob(UseCase):
     """
@@ -49,7 +108,7 @@ class CreateDocumentAnalysisJob(UseCase):
 
         await self._process_documents(analysis_job)
         await self.session.commit()
-        self._enqueue_analysis_task(analysis_job)
+        await self._enqueue_analysis_task(analysis_job)
 
         logger.info(
             "Analysis job submitted for processing",
@@ -88,17 +147,26 @@ class CreateDocumentAnalysisJob(UseCase):
         """Process and persist each uploaded document."""
         storage = get_storage()
 
-        for document_type, upload_file in self._get_document_mapping():
-            if upload_file is None:
-                continue
-
-            document = await self._store_and_create_document(
-                storage=storage,
-                analysis_job=analysis_job,
-                document_type=document_type,
-                upload_file=upload_file,
-            )
-            self.session.add(document)
+        # The uploads are independent, so their writes and hashing overlap
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                tasks = [
+                    task_group.create_task(
+                        self._store_and_create_document(
+                            storage=storage,
+                            analysis_job=analysis_job,
+                            document_type=document_type,
+                            upload_file=upload_file,
+                        )
+                    )
+                    for document_type, upload_file in self._get_document_mapping()
+                    if upload_file is not None
+                ]
+        except ExceptionGroup as e:
+            # Raise the failure itself so the API error handlers still see it
+            raise e.exceptions[0] from None
+
+        self.session.add_all([task.result() for task in tasks])
 
     async def _store_and_create_document(
         self,
@@ -110,8 +178,10 @@ class CreateDocumentAnalysisJob(UseCase):
         """Store file in storage and create Document record."""
         object_key = f"{analysis_job.id}/{document_type.value}/{upload_file.filename}"
 
-        content = await upload_file.read()
-        stored_info = await storage.save(content=content, object_key=object_key)
+        stored_info = await storage.save(
+            content=read_upload_file_chunks(upload_file),
+            object_key=object_key,
+        )
 
         logger.info(
             "Document stored successfully",
@@ -134,9 +204,11 @@ class CreateDocumentAnalysisJob(UseCase):
             object_key=stored_info.object_key,
         )
 
-    def _enqueue_analysis_task(self, analysis_job: models.AnalysisJob) -> None:
+    async def _enqueue_analysis_task(self, analysis_job: models.AnalysisJob) -> None:
         """Enqueue the Celery task to process the analysis job."""
-        celery_app.send_task(
+        # Publishing is a blocking broker round trip; keep it off the event loop
+        await asyncio.to_thread(
+            celery_app.send_task,
             "src.worker.tasks.analyze_documents_job",
             kwargs={
                 "job_id": str(analysis_job.id),
@@ -154,16 +226,17 @@ class GetDocumentAnalysisJob(UseCase):
     job_id: uuid.UUID
 
     async def handle(self) -> DictStrAny:
-        stmt = (
-            select(models.AnalysisJob)
-            .where(models.AnalysisJob.id == self.job_id)
-            .options(
-                selectinload(models.AnalysisJob.documents),
+        analysis_job = await models.AnalysisJob.get_by_id(
+            self.session,
+            id=self.job_id,
+            # Joining both collections would return documents x inconsistencies
+            # rows, each repeating the (large) extracted text, so only the
+            # documents are joined: 2 queries instead of 3
+            options=[
+                joinedload(models.AnalysisJob.documents),
                 selectinload(models.AnalysisJob.inconsistencies),
-            )
+            ],
         )
-        result = await self.session.exec(stmt)
-        analysis_job = result.one_or_none()
 
         if not analysis_job:
             logger.warning(
@@ -225,10 +298,15 @@ class AnalyzeDocuments(UseCase):
 
     job_id: uuid.UUID
 
+    @functools.cached_property
+    def job_id_str(self) -> str:
+        # Formatted once for every log record of the job
+        return str(self.job_id)
+
     async def handle(self) -> DictStrAny:
         logger.info(
             "Starting document analysis job",
-            extra={"job_id": str(self.job_id)},
+            extra={"job_id": self.job_id_str},
         )
 
         analysis_job = await self._load_analysis_job()
@@ -239,7 +317,7 @@ class AnalyzeDocuments(UseCase):
             analysis_result = await self._run_cross_document_analysis(
                 analysis_job, extraction_results
             )
-            self._persist_inconsistencies(
+            await self._persist_inconsistencies(
                 analysis_job, analysis_result, extraction_results
             )
             return await self._mark_job_succeeded(analysis_job, analysis_result)
@@ -248,20 +326,18 @@ class AnalyzeDocuments(UseCase):
             return await self._mark_job_failed(analysis_job, e)
 
     async def _load_analysis_job(self) -> models.AnalysisJob:
-        stmt = (
-            select(models.AnalysisJob)
-            .where(models.AnalysisJob.id == self.job_id)
-            .options(selectinload(models.AnalysisJob.documents))
+        analysis_job = await models.AnalysisJob.get_by_id(
+            self.session,
+            id=self.job_id,
+            options=[selectinload(models.AnalysisJob.documents)],
         )
-        result = await self.session.exec(stmt)
-        analysis_job = result.one_or_none()
 
         if not analysis_job:
             logger.error(
                 "Analysis job not found for processing",
-                extra={"job_id": str(self.job_id)},
+                extra={"job_id": self.job_id_str},
             )
-            raise AnalysisJobNotFoundError(job_id=str(self.job_id))
+            raise AnalysisJobNotFoundError(job_id=self.job_id_str)
 
         return analysis_job
 
@@ -273,46 +349,28 @@ class AnalyzeDocuments(UseCase):
         logger.info(
             "Analysis job status updated to RUNNING",
             extra={
-                "job_id": str(analysis_job.id),
+                "job_id": self.job_id_str,
                 "company_name": analysis_job.company_name,
                 "document_count": len(analysis_job.documents),
             },
         )
 
-    def _get_file_path(self, document: models.Document) -> str:
-        storage = get_storage()
-
-        if isinstance(storage, LocalFileStorage):
-            return str(storage.get_absolute_path(document.object_key))
-
-        raise NotImplementedError(
-            "Non-local storage not yet supported for PDF extraction"
-        )
+    def _get_file_path(self, document: models.Document, storage: FileStorage) -> str:
+        return get_document_file_path(document, storage)
 
     async def _extract_document_data(
         self,
         document: models.Document,
         extracted_text: str,
     ) -> DictStrAny | None:
-        extraction_result = None
-
-        if document.document_type == enums.DocumentType.CONTRATO_SOCIAL:
-            extraction_result = await agents.extract_contrato_social(
-                extracted_text=extracted_text,
-                correlation_id=self.correlation_id,
-            )
+        extractor_name = _EXTRACTOR_NAMES.get(document.document_type)
+        if extractor_name is None:
+            return None
 
-        elif document.document_type == enums.DocumentType.CARTAO_CNPJ:
-            extraction_result = await agents.extract_cartao_cnpj(
-                extracted_text=extracted_text,
-                correlation_id=self.correlation_id,
-            )
-
-        elif document.document_type == enums.DocumentType.CERTIDAO_NEGATIVA:
-            extraction_result = await agents.extract_certidao_negativa_federal(
-                extracted_text=extracted_text,
-                correlation_id=self.correlation_id,
-            )
+        extraction_result = await getattr(agents, extractor_name)(
+            extracted_text=extracted_text,
+            correlation_id=self.correlation_id,
+        )
 
         if extraction_result:
             document.extracted_data = extraction_result.data.model_dump(mode="json")
@@ -323,26 +381,33 @@ class AnalyzeDocuments(UseCase):
         self,
         analysis_job: models.AnalysisJob,
         document: models.Document,
+        storage: FileStorage,
+        known_extracted_text: str | None = None,
     ) -> DictStrAny | None:
+        document_id = str(document.id)
         logger.info(
             "Processing document",
             extra={
-                "job_id": str(analysis_job.id),
-                "document_id": str(document.id),
+                "job_id": self.job_id_str,
+                "document_id": document_id,
                 "document_type": document.document_type.value,
                 "document_filename": document.filename,
+                "reused_extracted_text": known_extracted_text is not None,
             },
         )
 
-        file_path = self._get_file_path(document)
-        extracted_text = extract_text_from_pdf(file_path)
+        if known_extracted_text is not None:
+            extracted_text = known_extracted_text
+        else:
+            file_path = self._get_file_path(document, storage)
+            extracted_text = await extract_document_text(file_path)
         document.extracted_text = extracted_text
 
         logger.debug(
             "PDF text extracted",
             extra={
-                "job_id": str(analysis_job.id),
-                "document_id": str(document.id),
+                "job_id": self.job_id_str,
+                "document_id": document_id,
                 "document_type": document.document_type.value,
                 "extracted_text_length": len(extracted_text),
             },
@@ -354,29 +419,92 @@ class AnalyzeDocuments(UseCase):
         logger.info(
             "Document extraction completed",
             extra={
-                "job_id": str(analysis_job.id),
-                "document_id": str(document.id),
+                "job_id": self.job_id_str,
+                "document_id": document_id,
                 "document_type": document.document_type.value,
             },
         )
 
         return extraction_result
 
+    async def _get_known_extracted_texts(
+        self,
+        documents: list[models.Document],
+    ) -> dict[str, str]:
+        """Map checksums to text already extracted from byte-identical uploads.
+
+        Only the text is reused: the LLM extraction depends on the model and
+        prompts, and its own cache is keyed by them.
+        """
+        checksums = {d.checksum_sha256 for d in documents if d.checksum_sha256}
+        if not checksums:
+            return {}
+
+        stmt = (
+            select(models.Document.checksum_sha256, models.Document.extracted_text)
+            .where(
+                models.Document.checksum_sha256.in_(checksums),
+                models.Document.extracted_text.is_not(None),
+                models.Document.deleted_at.is_(None),
+            )
+            .distinct(models.Document.checksum_sha256)
+        )
+        result = await self.session.exec(stmt)
+        return dict(result.all())
+
     async def _process_all_documents(
         self,
         analysis_job: models.AnalysisJob,
     ) -> dict[enums.DocumentType, DictStrAny]:
         extraction_results: dict[enums.DocumentType, DictStrAny] = {}
 
-        for document in analysis_job.documents:
-            extraction_result = await self._process_document(analysis_job, document)
+        # Each document needs its own LLM round trip, so run them concurrently
+        # instead of paying for them one after the other. A failing document
+        # doesn't cancel the others, whose extractions are still stored (and
+        # cached) for when the job is retried.
+        storage = get_storage()
+        # Looked up before the documents run concurrently, as they can't share
+        # the session
+        known_texts = await self._get_known_extracted_texts(analysis_job.documents)
+        results = await asyncio.gather(
+            *(
+                self._process_document(
+                    analysis_job,
+                    document,
+                    storage,
+                    known_texts.get(document.checksum_sha256),
+                )
+                for document in analysis_job.documents
+            ),
+            return_exceptions=True,
+        )
 
-            if extraction_result:
+        errors: list[BaseException] = []
+        for document, extraction_result in zip(
+            analysis_job.documents, results, strict=True
+        ):
+            if isinstance(extraction_result, BaseException):
+                logger.error(
+                    "Document processing failed",
+                    extra={
+                        "job_id": self.job_id_str,
+                        "document_id": str(document.id),
+                        "document_type": document.document_type.value,
+                        "error_type": type(extraction_result).__name__,
+                        "error_message": str(extraction_result),
+                    },
+                )
+                errors.append(extraction_result)
+            elif extraction_result:
                 extraction_results[document.document_type] = {
                     "result": extraction_result,
                     "document": document,
                 }
 
+        if errors:
+            # Surface the first failure itself so the job records its error code
+            raise errors[0]
+
         return extraction_results
 
     async def _run_cross_document_analysis(
@@ -387,7 +515,7 @@ class AnalyzeDocuments(UseCase):
         logger.info(
             "Starting cross-document analysis",
             extra={
-                "job_id": str(analysis_job.id),
+                "job_id": self.job_id_str,
                 "documents_extracted": list(extraction_results.keys()),
             },
         )
@@ -406,7 +534,7 @@ class AnalyzeDocuments(UseCase):
         logger.info(
             "Cross-document analysis completed",
             extra={
-                "job_id": str(analysis_job.id),
+                "job_id": self.job_id_str,
                 "decision": analysis_result.decision.value,
                 "inconsistencies_count": len(analysis_result.inconsistencies),
             },
@@ -414,20 +542,20 @@ class AnalyzeDocuments(UseCase):
 
         return analysis_result
 
-    def _persist_inconsistencies(
+    async def _persist_inconsistencies(
         self,
         analysis_job: models.AnalysisJob,
         analysis_result: agents.CrossDocumentAnalysisResult,
         extraction_results: dict[enums.DocumentType, DictStrAny],
     ) -> None:
+        document_ids = {
+            doc_type.value: data["document"].id
+            for doc_type, data in extraction_results.items()
+        }
+
+        rows = []
         for inc in analysis_result.inconsistencies:
-            document_id = None
-            if inc.documents:
-                doc_type_str = inc.documents[0]
-                for doc_type, data in extraction_results.items():
-                    if doc_type.value == doc_type_str:
-                        document_id = data["document"].id
-                        break
+            document_id = document_ids.get(inc.documents[0]) if inc.documents else None
 
             inconsistency = models.AnalysisInconsistency(
                 job_id=analysis_job.id,
@@ -441,12 +569,12 @@ class AnalyzeDocuments(UseCase):
                     "values": inc.values,
                 },
             )
-            self.session.add(inconsistency)
+            rows.append(inconsistency.model_dump())
 
             logger.info(
                 "Inconsistency detected",
                 extra={
-                    "job_id": str(analysis_job.id),
+                    "job_id": self.job_id_str,
                     "inconsistency_code": inc.code,
                     "severity": inc.severity.value,
                     "field": inc.field,
@@ -454,6 +582,11 @@ class AnalyzeDocuments(UseCase):
                 },
             )
 
+        # One bulk INSERT instead of tracking each row in the unit of work;
+        # it runs in the job's transaction, committed with the final status
+        if rows:
+            await self.session.execute(insert(models.AnalysisInconsistency), rows)
+
     async def _mark_job_succeeded(
         self,
         analysis_job: models.AnalysisJob,
@@ -461,15 +594,14 @@ class AnalyzeDocuments(UseCase):
     ) -> DictStrAny:
         analysis_job.decision = analysis_result.decision
         analysis_job.status = enums.AnalysisStatus.SUCCEEDED
-        analysis_job.finished_at = now()
-        analysis_job.updated_at = now()
+        analysis_job.finished_at = analysis_job.updated_at = now()
 
         await self.session.commit()
 
         logger.info(
             "Analysis job completed successfully",
             extra={
-                "job_id": str(analysis_job.id),
+                "job_id": self.job_id_str,
                 "company_name": analysis_job.company_name,
                 "status": analysis_job.status.value,
                 "decision": analysis_job.decision.value,
@@ -478,7 +610,7 @@ class AnalyzeDocuments(UseCase):
         )
 
         return {
-            "job_id": str(analysis_job.id),
+            "job_id": self.job_id_str,
             "status": analysis_job.status.value,
             "decision": analysis_job.decision.value if analysis_job.decision else None,
         }
@@ -496,7 +628,7 @@ class AnalyzeDocuments(UseCase):
         logger.exception(
             "Analysis job failed",
             extra={
-                "job_id": str(self.job_id),
+                "job_id": self.job_id_str,
                 "company_name": analysis_job.company_name,
                 "error_type": type(error).__name__,
                 "error_code": error_code,
@@ -511,13 +643,66 @@ class AnalyzeDocuments(UseCase):
             "error_code": error_code,
             **error_details,
         }
-        analysis_job.finished_at = now()
-        analysis_job.updated_at = now()
+        analysis_job.finished_at = analysis_job.updated_at = now()
 
         await self.session.commit()
 
         return {
-            "job_id": str(analysis_job.id),
+            "job_id": self.job_id_str,
             "status": analysis_job.status.value,
             "error": str(error),
         }
+
+
+class StreamDocumentExtraction(UseCase):
+    """
+    Stream the structured extraction of a stored document:
+    - Load the Document (and its text, extracting it from the PDF if needed)
+    - Return an async iterator of progressively complete extraction results
+    """
+
+    job_id: uuid.UUID
+    document_id: uuid.UUID
+
+    async def handle(self) -> tp.AsyncIterator[DictStrAny]:
+        # Primary key lookup: answered from the identity map when the document
+        # is already loaded, without building a statement otherwise
+        document = await self.session.get(models.Document, self.document_id)
+
+        if document is None or document.job_id != self.job_id:
+            logger.warning(
+                "Document not found",
+                extra={
+                    "job_id": str(self.job_id),
+                    "document_id": str(self.document_id),
+                },
+            )
+            raise DocumentNotFoundError(document_id=str(self.document_id))
+
+        stream_name = _STREAM_NAMES.get(document.document_type)
+        if stream_name is None:
+            raise InvalidDocumentTypeError(
+                document_type=str(document.document_type),
+                expected_types=[str(document_type) for document_type in _STREAM_NAMES],
+            )
+
+        extracted_text = document.extracted_text
+        if extracted_text is None:
+            extracted_text = await extract_document_text(
+                get_document_file_path(document)
+            )
+
+        # The DB work is done up front so the stream doesn't depend on the
+        # request session, which may be closed while the response is sent
+        return self._stream(stream_name, extracted_text)
+
+    async def _stream(
+        self,
+        stream_name: str,
+        extracted_text: str,
+    ) -> tp.AsyncIterator[DictStrAny]:
+        async for extraction_result in getattr(agents, stream_name)(
+            extracted_text=extracted_text,
+            correlation_id=self.correlation_id,
+        ):
+            yield extraction_result.model_dump(mode="json")
@@ -4,10 +4,47 @@ import asyncio
 import uuid
 from typing import Any
 
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
+
 from src import usecases
-from src.core.database.core import SessionFactory
+from src.core.base.agents import close_http_async_client
+from src.core.database.core import SessionFactory, engine
 from src.worker.celery import celery_app
 
+# One event loop per worker process, kept across tasks: the engine and the LLM
+# HTTP client are process-wide and bound to the loop that opened their
+# connections, so `asyncio.run` on every task would throw both away each time.
+# Tasks of a process therefore run one at a time on this loop, so only the
+# prefork (default) and solo pools are supported, not threads/gevent/eventlet.
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop
+
+
+@worker_process_init.connect
+def init_event_loop(**kwargs: Any) -> None:
+    # Created in each forked child, never inherited from the parent process
+    _get_event_loop()
+
+
+# The solo pool runs tasks in the main process, which only gets `worker_shutdown`
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def close_event_loop(**kwargs: Any) -> None:
+    global _loop
+    if _loop is None or _loop.is_closed():
+        return
+    _loop.run_until_complete(close_http_async_client())
+    _loop.run_until_complete(engine.dispose())
+    _loop.close()
+    _loop = None
+
 
 @celery_app.task(name="src.worker.tasks.ping")
 def ping() -> dict[str, str]:
@@ -28,4 +65,4 @@ def analyze_documents_job(
                 correlation_id=correlation_id,
             ).handle()
 
-    return asyncio.run(run_async_task(uuid.UUID(job_id)))
+    return _get_event_loop().run_until_complete(run_async_task(uuid.UUID(job_id)))
@@ -14,6 +14,7 @@ from src import enums
 from src.agents.cross_document_analyzer import (
     CrossDocumentAnalyzerState,
     deterministic_checks_node,
+    run_deterministic_checks,
 )
 from tests.factories import (
     CartaoCNPJDataFactory,
@@ -681,3 +682,22 @@ async def test_empty_qsa_has_no_inconsistency() -> None:
     cpf_mismatch = [inc for inc in inconsistencies if inc.code == "socio_cpf_mismatch"]
     assert len(cpf_mismatch) == 0
 
+
+def test_run_deterministic_checks_is_synchronous() -> None:
+    """
+    The deterministic checks can run without an event loop and decide the
+    analysis on their own.
+    """
+    contrato = ContratoSocialDataFactory.build(cnpj="12.345.678/0001-99")
+    cartao = CartaoCNPJDataFactory.build(cnpj="98.765.432/0001-11")
+
+    state = _build_initial_state(
+        contrato_social=contrato,
+        cartao_cnpj=cartao,
+    )
+
+    result = run_deterministic_checks(state)
+
+    codes = [inc.code for inc in result["inconsistencies"]]
+    assert "cnpj_mismatch" in codes
+    assert result["decision"] == enums.AnalysisDecision.REPROVADO
@@ -0,0 +1,248 @@
+"""
+Tests for the StructuredExtractor shared by the document extractors.
+
+The LLM is replaced by a fake chat model answering with tool call arguments,
+so these tests cover retries, batching and streaming without network calls.
+"""
+
+import typing as tp
+from pathlib import Path
+from unittest.mock import patch
+
+import orjson
+import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.messages.tool import tool_call
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import Field
+
+from src.agents import structured_extractor
+from src.agents.cartao_cnpj_extractor import (
+    CartaoCNPJData,
+    CartaoCNPJExtractionResult,
+)
+from src.agents.extraction_cache import ExtractionCache
+from src.agents.structured_extractor import StructuredExtractor
+from tests.factories import CartaoCNPJExtractionResultFactory
+
+
+class FakeToolCallingChatModel(BaseChatModel):
+    """Chat model answering each call with the tool arguments from `respond`."""
+
+    tool_name: str
+    respond: tp.Callable[[list[BaseMessage]], str]
+    calls: list[list[BaseMessage]] = Field(default_factory=list)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-tool-calling"
+
+    def bind_tools(self, tools: tp.Any, **kwargs: tp.Any) -> "FakeToolCallingChatModel":
+        return self
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: tp.Any = None,
+        **kwargs: tp.Any,
+    ) -> ChatResult:
+        self.calls.append(messages)
+        message = AIMessage(
+            content="",
+            tool_calls=[
+                tool_call(
+                    name=self.tool_name,
+                    args=orjson.loads(self.respond(messages)),
+                    id="call_0",
+                )
+            ],
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _stream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: tp.Any = None,
+        **kwargs: tp.Any,
+    ) -> tp.Iterator[ChatGenerationChunk]:
+        self.calls.append(messages)
+        args = self.respond(messages)
+        for start in range(0, len(args), 16):
+            yield ChatGenerationChunk(
+                message=AIMessageChunk(
+                    content="",
+                    tool_call_chunks=[
+                        {
+                            "name": self.tool_name if start == 0 else None,
+                            "args": args[start : start + 16],
+                            "id": "call_0" if start == 0 else None,
+                            "index": 0,
+                        }
+                    ],
+                )
+            )
+
+
+def _build_extractor() -> StructuredExtractor[CartaoCNPJExtractionResult]:
+    return StructuredExtractor(
+        result_schema=CartaoCNPJExtractionResult,
+        system_prompt="Extraia os dados do documento.",
+        user_prompt_header="Texto do documento:",
+        document_type="CARTAO_CNPJ",
+        extractor_name="test_extractor",
+        display_name="Teste",
+        max_validation_retries=2,
+    )
+
+
+def _build_llm(
+    extractor: StructuredExtractor,
+    respond: tp.Callable[[list[BaseMessage]], str],
+) -> FakeToolCallingChatModel:
+    return FakeToolCallingChatModel(
+        tool_name=extractor.tool_schema["function"]["name"],
+        respond=respond,
+    )
+
+
+@pytest.mark.asyncio
+async def test_extract_retries_with_feedback_when_output_fails_validation() -> None:
+    """
+    When the model first answers with output that fails schema validation,
+    the extractor retries quoting the invalid output and returns the valid result.
+    """
+    extractor = _build_extractor()
+    expected = CartaoCNPJExtractionResultFactory.build()
+    invalid_output = '{"data": {}, "confidence": 5}'
+    responses = iter([invalid_output, expected.model_dump_json()])
+    llm = _build_llm(extractor, lambda messages: next(responses))
+
+    with (
+        patch.object(structured_extractor, "get_llm", return_value=llm),
+        patch.object(structured_extractor, "get_extraction_cache", return_value=None),
+    ):
+        result = await extractor.extract(extracted_text="CARTÃO CNPJ")
+
+    assert result == expected
+    assert len(llm.calls) == 2
+    feedback = llm.calls[1][-1].content
+    assert '"confidence":5' in feedback
+    assert "confidence" in feedback.split("Erros:")[1]
+
+
+@pytest.mark.asyncio
+async def test_extract_batch_keeps_input_order_with_precomputed_results(
+    tmp_path: Path,
+) -> None:
+    """
+    When a batch mixes empty, cached and uncached texts,
+    only the uncached texts reach the model and results keep the input order.
+    """
+    extractor = _build_extractor()
+    cache = ExtractionCache(tmp_path)
+    cached = CartaoCNPJExtractionResultFactory.build()
+    generated = {
+        "texto A": CartaoCNPJExtractionResultFactory.build(),
+        "texto C": CartaoCNPJExtractionResultFactory.build(),
+    }
+
+    def respond(messages: list[BaseMessage]) -> str:
+        text = next(text for text in generated if text in messages[1].content)
+        return generated[text].model_dump_json()
+
+    llm = _build_llm(extractor, respond)
+
+    with (
+        patch.object(structured_extractor, "get_llm", return_value=llm),
+        patch.object(structured_extractor, "get_extraction_cache", return_value=cache),
+    ):
+        await extractor._set_cached("texto B", cached)
+        results = await extractor.extract_batch(
+            texts=["texto A", "   ", "texto B", "texto C"]
+        )
+
+    assert results[0] == generated["texto A"]
+    assert results[1].notes == ["empty input text"]
+    assert results[2] == cached
+    assert results[3] == generated["texto C"]
+    assert len(llm.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_partial_results_and_caches_the_final_one(
+    tmp_path: Path,
+) -> None:
+    """
+    When streaming an extraction,
+    the last yielded result is the complete one and it is cached afterwards.
+    """
+    extractor = _build_extractor()
+    cache = ExtractionCache(tmp_path)
+    expected = CartaoCNPJExtractionResultFactory.build()
+    llm = _build_llm(extractor, lambda messages: expected.model_dump_json())
+
+    with (
+        patch.object(structured_extractor, "get_llm", return_value=llm),
+        patch.object(structured_extractor, "get_extraction_cache", return_value=cache),
+    ):
+        results = [
+            result async for result in extractor.stream(extracted_text="CARTÃO CNPJ")
+        ]
+        cached = await extractor._get_cached("CARTÃO CNPJ")
+
+    assert results
+    assert results[-1] == expected
+    assert cached == expected
+
+
+@pytest.mark.asyncio
+async def test_stream_does_not_cache_truncated_output(tmp_path: Path) -> None:
+    """
+    When the streamed output is cut short but still partially parses,
+    the partial result is yielded but not cached.
+    """
+    extractor = _build_extractor()
+    cache = ExtractionCache(tmp_path)
+    result = CartaoCNPJExtractionResultFactory.build()
+    # `confidence` comes first so the truncated output still has every required key
+    output = orjson.dumps(
+        {"confidence": result.confidence, **result.model_dump(mode="json")}
+    ).decode()
+    llm = _build_llm(
+        extractor, lambda messages: output[: output.index(',"nome_fantasia"')]
+    )
+
+    with (
+        patch.object(structured_extractor, "get_llm", return_value=llm),
+        patch.object(structured_extractor, "get_extraction_cache", return_value=cache),
+    ):
+        results = [
+            result async for result in extractor.stream(extracted_text="CARTÃO CNPJ")
+        ]
+        cached = await extractor._get_cached("CARTÃO CNPJ")
+
+    assert results
+    assert cached is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("extracted_text", ["", "   ", "\n\t \n"])
+async def test_extract_returns_empty_result_without_calling_the_llm_for_blank_text(
+    extracted_text: str,
+) -> None:
+    """
+    When the extracted text is empty or whitespace-only,
+    an empty result with zero confidence is returned without calling the LLM.
+    """
+    extractor = _build_extractor()
+
+    with patch.object(structured_extractor, "get_llm") as mock_get_llm:
+        result = await extractor.extract(extracted_text=extracted_text)
+
+    mock_get_llm.assert_not_called()
+    assert result.data == CartaoCNPJData()
+    assert result.confidence == 0.0
+    assert result.notes == ["empty input text"]
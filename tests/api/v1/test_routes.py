@@ -1,3 +1,4 @@
+import json
 import uuid
 from pathlib import Path
 from unittest.mock import patch
@@ -7,10 +8,13 @@ from httpx import AsyncClient
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src import enums, models
+from src import agents, enums, models
+from src.exceptions import LLMServiceError
+from tests.conftest import QueryCounter
 from tests.factories import (
     AnalysisInconsistencyFactory,
     AnalysisJobFactory,
+    ContratoSocialExtractionResultFactory,
     DocumentFactory,
 )
 
@@ -339,7 +343,6 @@ async def test_get_document_analysis_job_returns_200_with_job_data(
     analysis_job = AnalysisJobFactory.build(company_name="Test Company")
     session.add(analysis_job)
     await session.commit()
-    await session.refresh(analysis_job)
 
     response = await client.get(f"/v1/analyses/{analysis_job.id}")
 
@@ -378,9 +381,6 @@ async def test_get_document_analysis_job_includes_documents_in_response(
     the response includes document details.
     """
     analysis_job = AnalysisJobFactory.build(company_name="Company With Docs")
-    session.add(analysis_job)
-    await session.flush()
-
     document = DocumentFactory.build(
         job_id=analysis_job.id,
         document_type=enums.DocumentType.CONTRATO_SOCIAL,
@@ -388,10 +388,8 @@ async def test_get_document_analysis_job_includes_documents_in_response(
         size_bytes=1024,
         checksum_sha256="abc123",
     )
-    session.add(document)
+    session.add_all([analysis_job, document])
     await session.commit()
-    await session.refresh(analysis_job)
-    await session.refresh(document)
 
     response = await client.get(f"/v1/analyses/{analysis_job.id}")
 
@@ -408,6 +406,7 @@ async def test_get_document_analysis_job_includes_documents_in_response(
 async def test_get_document_analysis_job_includes_inconsistencies_in_response(
     client: AsyncClient,
     session: AsyncSession,
+    query_counter: QueryCounter,
 ) -> None:
     """
     When fetching an analysis job with inconsistencies,
@@ -418,23 +417,21 @@ async def test_get_document_analysis_job_includes_inconsistencies_in_response(
         status=enums.AnalysisStatus.SUCCEEDED,
         decision=enums.AnalysisDecision.REPROVADO,
     )
-    session.add(analysis_job)
-    await session.flush()
-
     inconsistency = AnalysisInconsistencyFactory.build(
         job_id=analysis_job.id,
         code="cnpj_mismatch",
         severity=enums.InconsistencySeverity.BLOCKER,
         message="CNPJ does not match between documents",
     )
-    session.add(inconsistency)
+    session.add_all([analysis_job, inconsistency])
     await session.commit()
-    await session.refresh(analysis_job)
-    await session.refresh(inconsistency)
 
+    query_counter.reset()
     response = await client.get(f"/v1/analyses/{analysis_job.id}")
 
     assert response.status_code == 200
+    # The job, its documents and its inconsistencies are loaded eagerly
+    assert query_counter.count <= 3
     data = response.json()
     assert len(data["inconsistencies"]) == 1
     assert data["inconsistencies"][0]["id"] == str(inconsistency.id)
@@ -461,7 +458,6 @@ async def test_get_document_analysis_job_returns_succeeded_job_with_decision(
     )
     session.add(analysis_job)
     await session.commit()
-    await session.refresh(analysis_job)
 
     response = await client.get(f"/v1/analyses/{analysis_job.id}")
 
@@ -488,7 +484,6 @@ async def test_get_document_analysis_job_returns_failed_job_with_error_details(
     )
     session.add(analysis_job)
     await session.commit()
-    await session.refresh(analysis_job)
 
     response = await client.get(f"/v1/analyses/{analysis_job.id}")
 
@@ -504,6 +499,7 @@ async def test_get_document_analysis_job_returns_failed_job_with_error_details(
 async def test_get_document_analysis_job_returns_multiple_documents(
     client: AsyncClient,
     session: AsyncSession,
+    query_counter: QueryCounter,
 ) -> None:
     """
     When fetching an analysis job with multiple documents,
@@ -513,9 +509,6 @@ async def test_get_document_analysis_job_returns_multiple_documents(
         company_name="Multi Doc Company",
         status=enums.AnalysisStatus.RUNNING,
     )
-    session.add(analysis_job)
-    await session.flush()
-
     documents = [
         DocumentFactory.build(
             job_id=analysis_job.id,
@@ -533,13 +526,15 @@ async def test_get_document_analysis_job_returns_multiple_documents(
             filename="certidao.pdf",
         ),
     ]
-    for doc in documents:
-        session.add(doc)
+    session.add_all([analysis_job, *documents])
     await session.commit()
 
+    query_counter.reset()
     response = await client.get(f"/v1/analyses/{analysis_job.id}")
 
     assert response.status_code == 200
+    # Doesn't grow with the number of documents
+    assert query_counter.count <= 3
     data = response.json()
     assert len(data["documents"]) == 3
 
@@ -563,7 +558,6 @@ async def test_get_document_analysis_job_returns_empty_lists_when_no_documents_o
     analysis_job = AnalysisJobFactory.build(company_name="Empty Job Company")
     session.add(analysis_job)
     await session.commit()
-    await session.refresh(analysis_job)
 
     response = await client.get(f"/v1/analyses/{analysis_job.id}")
 
@@ -571,3 +565,96 @@ async def test_get_document_analysis_job_returns_empty_lists_when_no_documents_o
     data = response.json()
     assert data["documents"] == []
     assert data["inconsistencies"] == []
+
+
+@pytest.mark.asyncio
+async def test_stream_document_extraction_returns_404_for_nonexistent_document(
+    client: AsyncClient,
+    session: AsyncSession,
+) -> None:
+    """
+    When streaming the extraction of a non-existent document,
+    the endpoint returns HTTP 404.
+    """
+    response = await client.get(
+        f"/v1/analyses/{uuid.uuid4()}/documents/{uuid.uuid4()}/extraction/stream"
+    )
+
+    assert response.status_code == 404
+    assert response.json()["error"]["code"] == "document_not_found"
+
+
+@pytest.mark.asyncio
+async def test_stream_document_extraction_streams_results_as_server_sent_events(
+    client: AsyncClient,
+    session: AsyncSession,
+) -> None:
+    """
+    When streaming the extraction of an already processed document,
+    each partial result is sent as an SSE data event followed by a done event.
+    """
+    analysis_job = AnalysisJobFactory.build()
+    document = DocumentFactory.build(
+        job_id=analysis_job.id,
+        document_type=enums.DocumentType.CONTRATO_SOCIAL,
+        extracted_text="CONTRATO SOCIAL DA TECH SOLUTIONS LTDA",
+    )
+    session.add_all([analysis_job, document])
+    await session.commit()
+
+    extraction_result = ContratoSocialExtractionResultFactory.build()
+
+    async def fake_stream(**kwargs):
+        yield extraction_result
+
+    with patch.object(agents, "stream_contrato_social", fake_stream):
+        response = await client.get(
+            f"/v1/analyses/{analysis_job.id}/documents/{document.id}/extraction/stream"
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    data_event, done_event, _ = response.text.split("\n\n")
+    assert json.loads(data_event.removeprefix("data: ")) == (
+        extraction_result.model_dump(mode="json")
+    )
+    assert done_event == "event: done\ndata: {}"
+
+
+@pytest.mark.asyncio
+async def test_stream_document_extraction_sends_error_event_when_llm_fails(
+    client: AsyncClient,
+    session: AsyncSession,
+) -> None:
+    """
+    When the LLM fails after the stream has started,
+    the error is sent as an SSE error event and no done event follows.
+    """
+    analysis_job = AnalysisJobFactory.build()
+    document = DocumentFactory.build(
+        job_id=analysis_job.id,
+        document_type=enums.DocumentType.CONTRATO_SOCIAL,
+        extracted_text="CONTRATO SOCIAL DA TECH SOLUTIONS LTDA",
+    )
+    session.add_all([analysis_job, document])
+    await session.commit()
+
+    extraction_result = ContratoSocialExtractionResultFactory.build()
+
+    async def fake_stream(**kwargs):
+        yield extraction_result
+        raise LLMServiceError("Failed to stream LLM output")
+
+    with patch.object(agents, "stream_contrato_social", fake_stream):
+        response = await client.get(
+            f"/v1/analyses/{analysis_job.id}/documents/{document.id}/extraction/stream"
+        )
+
+    assert response.status_code == 200
+    data_event, error_event, _ = response.text.split("\n\n")
+    assert data_event.startswith("data: ")
+    event_line, data_line = error_event.split("\n")
+    assert event_line == "event: error"
+    error = json.loads(data_line.removeprefix("data: "))["error"]
+    assert error["code"] == "llm_service_error"
+    assert error["message"] == "Failed to stream LLM output"
@@ -6,6 +6,7 @@ from pathlib import Path
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     async_sessionmaker,
@@ -38,6 +39,10 @@ async def engine(connection_url: str) -> tp.AsyncGenerator[AsyncEngine, None]:
 
     yield engine
 
+    # Each test gets its own event loop, so its pooled connections can't be
+    # reused by the next test and are closed instead of left to the container
+    await engine.dispose()
+
 
 @pytest_asyncio.fixture(scope="function")
 async def session(engine: AsyncEngine) -> tp.AsyncGenerator[AsyncSession, None]:
@@ -63,6 +68,28 @@ async def client_session(engine: AsyncEngine) -> tp.AsyncGenerator[AsyncSession,
         yield _session
 
 
+class QueryCounter:
+    """Counts the statements sent to the database while it's listening."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, *args: tp.Any) -> None:
+        self.count += 1
+
+    def reset(self) -> None:
+        self.count = 0
+
+
+@pytest.fixture
+def query_counter(engine: AsyncEngine) -> tp.Generator[QueryCounter, None, None]:
+    """Count the queries run on the test engine, e.g. to catch N+1 loading."""
+    counter = QueryCounter()
+    event.listen(engine.sync_engine, "before_cursor_execute", counter)
+    yield counter
+    event.remove(engine.sync_engine, "before_cursor_execute", counter)
+
+
 @pytest.fixture(scope="function")
 def event_loop() -> tp.Generator[asyncio.AbstractEventLoop, None, None]:
     policy = asyncio.get_event_loop_policy()
@@ -71,31 +98,34 @@ def event_loop() -> tp.Generator[asyncio.AbstractEventLoop, None, None]:
     loop.close()
 
 
-@pytest.fixture
-def client(client_session: AsyncSession) -> AsyncClient:
+@pytest_asyncio.fixture
+async def client(client_session: AsyncSession) -> tp.AsyncGenerator[AsyncClient, None]:
     app.dependency_overrides[get_session] = lambda: client_session
-    client = AsyncClient(
+    # Closed on teardown so each test releases its transport
+    async with AsyncClient(
         transport=ASGITransport(app=app),
         base_url="http://test",
-    )
-    return client
+    ) as client:
+        yield client
+    # Don't leak this test's session into the next use of the app
+    app.dependency_overrides.pop(get_session, None)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def contrato_social_pdf() -> bytes:
     """Load a sample contrato social PDF for testing."""
     pdf_path = DOCS_DIR / "Tech Solutions" / "01_contrato_social.pdf"
     return pdf_path.read_bytes()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cartao_cnpj_pdf() -> bytes:
     """Load a sample cartão CNPJ PDF for testing."""
     pdf_path = DOCS_DIR / "Tech Solutions" / "02_cartao_cnpj.pdf"
     return pdf_path.read_bytes()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def certidao_negativa_pdf() -> bytes:
     """Load a sample certidão negativa PDF for testing."""
     pdf_path = DOCS_DIR / "Tech Solutions" / "03_certidao_negativa_federal.pdf"
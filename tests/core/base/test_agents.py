@@ -0,0 +1,28 @@
+"""
+Tests for the helpers shared by the LLM agents.
+"""
+
+import pytest
+
+from src.core.base.agents import truncate_text
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "   ",
+        "\n\t \n",
+        "CNPJ 12.345.678/0001-90",
+        "  \n CNPJ 12.345.678/0001-90",
+        "CNPJ 12.345.678/0001-90 \n\t",
+        "\n  CNPJ   12.345.678/0001-90  \n",
+    ],
+)
+@pytest.mark.parametrize("max_chars", [0, 1, 4, 6000])
+def test_truncate_text_matches_strip_and_slice(text: str, max_chars: int) -> None:
+    """
+    For texts with leading, trailing or only whitespace,
+    truncate_text returns the same as `text.strip()[:max_chars]`.
+    """
+    assert truncate_text(text, max_chars=max_chars) == text.strip()[:max_chars]
@@ -0,0 +1,37 @@
+"""
+Tests for the query helpers shared by every database model.
+"""
+
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src import models
+from src.core.utils.datetime import now
+from tests.factories import AnalysisJobFactory
+
+
+@pytest.mark.asyncio
+async def test_filter_excludes_soft_deleted_rows_unless_included(
+    session: AsyncSession,
+) -> None:
+    """
+    When some rows are soft-deleted,
+    filter skips them by default and returns them with include_deleted=True.
+    """
+    live_job = AnalysisJobFactory.build()
+    deleted_job = AnalysisJobFactory.build(deleted_at=now())
+    session.add_all([live_job, deleted_job])
+    await session.commit()
+
+    # Scoped to this test's rows, since the database is shared between tests
+    filters = [models.AnalysisJob.id.in_([live_job.id, deleted_job.id])]
+
+    live_jobs = await models.AnalysisJob.filter(session, filters=filters)
+    all_jobs = await models.AnalysisJob.filter(
+        session,
+        filters=filters,
+        include_deleted=True,
+    )
+
+    assert [job.id for job in live_jobs] == [live_job.id]
+    assert {job.id for job in all_jobs} == {live_job.id, deleted_job.id}
@@ -0,0 +1,59 @@
+"""
+Tests for the orjson-backed JSON log formatter.
+"""
+
+import logging
+import uuid
+
+import orjson
+
+from src.core.logging.formatters import JSONFormatter
+
+
+def _build_record(**extra: object) -> logging.LogRecord:
+    record = logging.LogRecord(
+        name="src.usecases.analysis",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=1,
+        msg="Processing document %s",
+        args=("01_contrato_social.pdf",),
+        exc_info=None,
+    )
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter_emits_standard_keys_and_extra_fields() -> None:
+    """
+    When formatting a record with `extra` fields,
+    the output has timestamp, level, correlation_id and message plus the extras.
+    """
+    job_id = uuid.uuid4()
+    record = _build_record(correlation_id="abc-123", job_id=job_id, attempt=2)
+
+    payload = orjson.loads(JSONFormatter().format(record))
+
+    assert set(payload) == {
+        "timestamp",
+        "level",
+        "correlation_id",
+        "message",
+        "job_id",
+        "attempt",
+    }
+    assert payload["level"] == "INFO"
+    assert payload["correlation_id"] == "abc-123"
+    assert payload["message"] == "Processing document 01_contrato_social.pdf"
+    assert payload["job_id"] == str(job_id)
+    assert payload["attempt"] == 2
+
+
+def test_json_formatter_sets_null_correlation_id_when_missing() -> None:
+    """
+    When a record has no correlation id,
+    the key is still present with a null value.
+    """
+    payload = orjson.loads(JSONFormatter().format(_build_record()))
+
+    assert payload["correlation_id"] is None
@@ -0,0 +1,55 @@
+"""
+Tests for the local file storage backend.
+
+These tests write to a temporary directory and don't need the database.
+"""
+
+import typing as tp
+from pathlib import Path
+
+import pytest
+
+from src.core.storage.backends import WRITE_CHUNK_SIZE, LocalFileStorage
+
+
+async def _iter_chunks(chunks: list[bytes]) -> tp.AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.mark.asyncio
+async def test_save_stream_matches_checksum_and_size_of_the_content(
+    tmp_path: Path,
+) -> None:
+    """
+    When saving content as a stream of chunks,
+    the stored file, checksum and size match the concatenated content.
+    """
+    storage = LocalFileStorage(tmp_path)
+    chunks = [b"%PDF-1.7\n", b"x" * WRITE_CHUNK_SIZE, b"", b"%%EOF\n"]
+    content = b"".join(chunks)
+
+    info = await storage.save(_iter_chunks(chunks), "job/document.pdf")
+
+    assert info.object_key == "job/document.pdf"
+    assert info.size_bytes == len(content)
+    assert info.checksum_sha256 == LocalFileStorage.compute_checksum(content)
+    assert await storage.load("job/document.pdf") == content
+
+
+@pytest.mark.asyncio
+async def test_save_stream_removes_the_partial_file_on_error(tmp_path: Path) -> None:
+    """
+    When the chunk stream fails midway,
+    the error propagates and no partial file is left behind.
+    """
+    storage = LocalFileStorage(tmp_path)
+
+    async def failing_chunks() -> tp.AsyncIterator[bytes]:
+        yield b"%PDF-1.7\n"
+        raise ConnectionResetError("client disconnected")
+
+    with pytest.raises(ConnectionResetError):
+        await storage.save(failing_chunks(), "job/document.pdf")
+
+    assert not await storage.exists("job/document.pdf")
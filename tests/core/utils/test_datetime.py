@@ -0,0 +1,34 @@
+"""
+Tests for the date helpers used by the deterministic checks.
+"""
+
+from datetime import date
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from src.core.utils.datetime import subtract_months
+
+
+@pytest.mark.parametrize(
+    ("value", "months", "expected"),
+    [
+        (date(2025, 8, 31), 6, date(2025, 2, 28)),
+        (date(2024, 8, 31), 6, date(2024, 2, 29)),
+        (date(2025, 3, 31), 1, date(2025, 2, 28)),
+        (date(2025, 1, 15), 6, date(2024, 7, 15)),
+        (date(2025, 6, 30), 0, date(2025, 6, 30)),
+        (date(2025, 12, 31), 12, date(2024, 12, 31)),
+    ],
+)
+def test_subtract_months_clamps_to_the_end_of_the_target_month(
+    value: date,
+    months: int,
+    expected: date,
+) -> None:
+    """
+    When the target month is shorter than the day of the month,
+    the result is clamped to its last day, as relativedelta does.
+    """
+    assert subtract_months(value, months) == expected
+    assert subtract_months(value, months) == value - relativedelta(months=months)
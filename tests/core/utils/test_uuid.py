@@ -0,0 +1,40 @@
+"""
+Tests for the UUIDv7 generator used for primary keys.
+"""
+
+import time
+import uuid
+
+from src.core.utils.uuid import uuid7
+
+
+def test_uuid7_sets_version_and_variant_bits() -> None:
+    """
+    A generated id is a version 7 UUID with the RFC 9562 variant.
+    """
+    value = uuid7()
+
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_embeds_the_current_timestamp() -> None:
+    """
+    The 48 most significant bits hold the Unix timestamp in milliseconds.
+    """
+    before_ms = time.time_ns() // 1_000_000
+    value = uuid7()
+    after_ms = time.time_ns() // 1_000_000
+
+    assert before_ms <= value.int >> 80 <= after_ms
+
+
+def test_uuid7_is_monotonic_within_the_same_millisecond() -> None:
+    """
+    When many ids are generated in a tight loop,
+    each one sorts after the previous one and none repeat.
+    """
+    values = [uuid7() for _ in range(10_000)]
+
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
@@ -67,7 +67,8 @@ class DocumentFactory(factory.Factory):
     )
     content_type = "application/pdf"
     size_bytes = factory.Faker("random_int", min=1024, max=1048576)
-    checksum_sha256 = factory.Faker("sha256")
+    # Unique per build without hashing random bytes
+    checksum_sha256 = factory.Sequence(lambda n: f"{n:064x}")
     object_key = factory.LazyAttribute(
         lambda obj: f"{obj.job_id}/{obj.document_type.value}/{obj.filename}"
     )
@@ -146,7 +147,7 @@ class ContratoSocialDataFactory(factory.Factory):
     data_registro = None
     junta_comercial = "JUCESP"
     sede = SubFactory(EnderecoFactory)
-    objeto_social = factory.Faker("paragraph", locale="pt_BR")
+    objeto_social = "Objeto social de teste."
     socios = factory.LazyFunction(list)
 
 
@@ -191,7 +192,7 @@ class CNAEFactory(factory.Factory):
         model = CNAE
 
     codigo = factory.Faker("numerify", text="####-#/##")
-    descricao = factory.Faker("sentence", locale="pt_BR")
+    descricao = "Descrição CNAE de teste."
 
 
 class SocioQSAFactory(factory.Factory):
@@ -257,7 +258,7 @@ class CertidaoNegativaFederalDataFactory(factory.Factory):
         "e à Dívida Ativa da União"
     )
     numero_certidao = factory.Faker("numerify", text="####.####.####.####")
-    codigo_autenticidade = factory.Faker("uuid4")
+    codigo_autenticidade = LazyFunction(lambda: str(uuid.uuid4()))
     data_emissao = factory.LazyFunction(date.today)
     data_validade = factory.LazyAttribute(
         lambda obj: date(
@@ -0,0 +1,46 @@
+"""
+Tests for the PDF text extraction service.
+"""
+
+from pathlib import Path
+
+import pymupdf
+import pytest
+
+from src.services.pdf import (
+    MIN_PAGES_FOR_PARALLEL_EXTRACTION,
+    extract_text_from_pdf,
+    shutdown_extraction_pool,
+)
+
+
+@pytest.fixture
+def long_pdf_path(tmp_path: Path) -> Path:
+    """Write a PDF long enough to be extracted in parallel page ranges."""
+    pdf_path = tmp_path / "contrato_social.pdf"
+    with pymupdf.open() as doc:
+        for page_number in range(MIN_PAGES_FOR_PARALLEL_EXTRACTION + 3):
+            page = doc.new_page()
+            page.insert_text(
+                (72, 72),
+                f"CLÁUSULA {page_number + 1} - O capital social é de R$ 100.000,00.",
+            )
+        doc.save(pdf_path)
+    return pdf_path
+
+
+def test_parallel_and_serial_extraction_return_identical_text(
+    long_pdf_path: Path,
+) -> None:
+    """
+    When a long PDF is extracted in parallel page ranges,
+    the text is identical to the serial extraction, with pages in order.
+    """
+    serial_text = extract_text_from_pdf(str(long_pdf_path), num_workers=1)
+    try:
+        parallel_text = extract_text_from_pdf(str(long_pdf_path), num_workers=3)
+    finally:
+        shutdown_extraction_pool()
+
+    assert parallel_text == serial_text
+    assert serial_text.index("CLÁUSULA 1 ") < serial_text.index("CLÁUSULA 19 ")
@@ -142,7 +142,9 @@ async def test_analyze_documents_updates_job_status_to_succeeded_on_success(
     assert result["decision"] == enums.AnalysisDecision.APROVADO.value
 
     # Verify job was updated in database
-    await session.refresh(analysis_job)
+    await session.refresh(
+        analysis_job, attribute_names=["status", "decision", "finished_at"]
+    )
     assert analysis_job.status == enums.AnalysisStatus.SUCCEEDED
     assert analysis_job.decision == enums.AnalysisDecision.APROVADO
     assert analysis_job.finished_at is not None
@@ -204,7 +206,7 @@ async def test_analyze_documents_extracts_text_and_stores_in_document(
             correlation_id="test-correlation-id",
         ).handle()
 
-    await session.refresh(document)
+    await session.refresh(document, attribute_names=["extracted_text"])
     assert document.extracted_text == extracted_text
 
 
@@ -262,7 +264,7 @@ async def test_analyze_documents_stores_extracted_data_in_document(
             correlation_id="test-correlation-id",
         ).handle()
 
-    await session.refresh(document)
+    await session.refresh(document, attribute_names=["extracted_data"])
     assert document.extracted_data is not None
     assert document.extracted_data["razao_social"] == "Test Company LTDA"
     assert document.extracted_data["cnpj"] == "12.345.678/0001-99"
@@ -328,7 +330,10 @@ async def test_analyze_documents_updates_job_status_to_failed_on_error(
     assert result["status"] == enums.AnalysisStatus.FAILED.value
     assert "error" in result
 
-    await session.refresh(analysis_job)
+    await session.refresh(
+        analysis_job,
+        attribute_names=["status", "error_message", "error_details", "finished_at"],
+    )
     assert analysis_job.status == enums.AnalysisStatus.FAILED
     assert analysis_job.error_message == "PDF extraction failed"
     assert analysis_job.error_details["error_type"] == "Exception"
@@ -544,9 +549,9 @@ async def test_analyze_documents_updates_status_to_running_during_processing(
 
     def capture_status(file_path: str) -> str:
         nonlocal status_during_extraction
-        # Query the job status at this point - need to create new session query
-        # We capture the status that was set before this call
-        status_during_extraction = enums.AnalysisStatus.RUNNING
+        # The usecase shares this session, so its identity map hands it this
+        # same job instance and the status it set is visible here
+        status_during_extraction = analysis_job.status
         return "Extracted text"
 
     with (
@@ -695,3 +700,66 @@ async def test_analyze_documents_calls_correct_extractor_for_certidao_negativa(
         extracted_text="Certidão text",
         correlation_id="test-correlation-id",
     )
+
+
+@pytest.mark.asyncio
+async def test_analyze_documents_reuses_extracted_text_of_identical_documents(
+    session: AsyncSession,
+    temp_storage_dir: Path,
+    mock_contrato_social_result: ContratoSocialExtractionResult,
+    mock_analysis_result: CrossDocumentAnalysisResult,
+) -> None:
+    """
+    When a document with the same checksum was already extracted in another job,
+    its text is reused and the PDF is not extracted again.
+    """
+    checksum_sha256 = uuid.uuid4().hex * 2
+    extracted_text = "CONTRATO SOCIAL - Test Company LTDA - CNPJ: 12.345.678/0001-99"
+
+    previous_job = AnalysisJobFactory.build(company_name="Test Company")
+    analysis_job = AnalysisJobFactory.build(company_name="Test Company")
+    session.add_all([previous_job, analysis_job])
+    await session.flush()
+
+    previous_document = DocumentFactory.build(
+        job_id=previous_job.id,
+        document_type=enums.DocumentType.CONTRATO_SOCIAL,
+        checksum_sha256=checksum_sha256,
+        extracted_text=extracted_text,
+    )
+    document = DocumentFactory.build(
+        job_id=analysis_job.id,
+        document_type=enums.DocumentType.CONTRATO_SOCIAL,
+        checksum_sha256=checksum_sha256,
+    )
+    session.add_all([previous_document, document])
+    await session.commit()
+
+    with (
+        patch("src.usecases.analysis.extract_text_from_pdf") as mock_extract_text,
+        patch.object(
+            agents,
+            "extract_contrato_social",
+            new_callable=AsyncMock,
+            return_value=mock_contrato_social_result,
+        ) as mock_extractor,
+        patch.object(
+            agents,
+            "analyze_documents",
+            new_callable=AsyncMock,
+            return_value=mock_analysis_result,
+        ),
+    ):
+        await usecases.AnalyzeDocuments(
+            session=session,
+            job_id=analysis_job.id,
+            correlation_id="test-correlation-id",
+        ).handle()
+
+    mock_extract_text.assert_not_called()
+    mock_extractor.assert_called_once_with(
+        extracted_text=extracted_text,
+        correlation_id="test-correlation-id",
+    )
+    await session.refresh(document, attribute_names=["extracted_text"])
+    assert document.extracted_text == extracted_text
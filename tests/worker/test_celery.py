@@ -0,0 +1,39 @@
+"""
+Tests for the Celery app configuration.
+"""
+
+import uuid
+
+from kombu.serialization import dumps, loads, prepare_accept_content
+
+from src.worker.celery import celery_app
+
+
+def test_orjson_serializer_round_trips_task_payloads_through_kombu() -> None:
+    """
+    When a task payload is encoded with the orjson serializer,
+    kombu decodes it back to the same payload under the orjson content type.
+    """
+    payload = [
+        [],
+        {"job_id": str(uuid.uuid4()), "correlation_id": "abc-123"},
+        {"callbacks": None, "errbacks": None, "chain": None, "chord": None},
+    ]
+
+    content_type, content_encoding, body = dumps(payload, serializer="orjson")
+
+    assert content_type == "application/x-orjson"
+    assert content_encoding == "utf-8"
+    # Celery resolves the accepted serializer names the same way
+    accept = prepare_accept_content(celery_app.conf.accept_content)
+    assert loads(body, content_type, content_encoding, accept=accept) == payload
+
+
+def test_celery_app_uses_orjson_for_tasks_and_results() -> None:
+    """
+    Tasks and results are serialized with orjson,
+    while plain JSON messages are still accepted.
+    """
+    assert celery_app.conf.task_serializer == "orjson"
+    assert celery_app.conf.result_serializer == "orjson"
+    assert set(celery_app.conf.accept_content) == {"orjson", "json"}